@@ -81,11 +81,11 @@ def run_cw_sweep(
                     max_sync_slot_desync, min_sync_slot_desync,
                     3, min_nru_cw, max_nru_cw, 6
                 ),  # NR-U configuration
-                {key: {ap_number: 0} for key in range(cw + 1)},  # Backoff counters
-                {f"WiFiStation {i}": 0 for i in range(1, ap_number + 1)},  # Wi-Fi data airtime
-                {f"WiFiStation {i}": 0 for i in range(1, ap_number + 1)},  # Wi-Fi control airtime
-                {f"NRUBaseStation {i}": 0 for i in range(1, gnb_number + 1)},  # NR-U data airtime
-                {f"NRUBaseStation {i}": 0 for i in range(1, gnb_number + 1)},  # NR-U control airtime
+                np.zeros(cw + 1, dtype=np.int64),  # Backoff counters
+                np.zeros(ap_number, dtype=np.float64),  # Wi-Fi data airtime
+                np.zeros(ap_number, dtype=np.float64),  # Wi-Fi control airtime
+                np.zeros(gnb_number, dtype=np.float64),  # NR-U data airtime
+                np.zeros(gnb_number, dtype=np.float64),  # NR-U control airtime
                 nru_mode,  # NR-U operational mode
                 temp_output_file  # Temporary output file
             )
@@ -325,12 +325,12 @@ def changing_number_nodes(
             min_wifi_cw = max_wifi_cw = cw  # Set both min and max to the same value
             print(f"Using calculated contention window {cw} for WiFi nodes: {wifi_nodes}, NR-U nodes: {nru_nodes}")
 
-        # Initialize statistics tracking dictionaries for this node pair
-        backoff_counts = {key: {wifi_nodes: 0} for key in range(max_wifi_cw + 1)}
-        data_airtime_WiFi = {"WiFiStation {}".format(i): 0 for i in range(1, wifi_nodes + 1)}
-        control_airtime_WiFi = {"WiFiStation {}".format(i): 0 for i in range(1, wifi_nodes + 1)}
-        data_airtime_NR = {"NRUBaseStation {}".format(i): 0 for i in range(1, nru_nodes + 1)}
-        control_airtime_NR = {"NRUBaseStation {}".format(i): 0 for i in range(1, nru_nodes + 1)}
+        # Initialize statistics tracking arrays for this node pair
+        backoff_counts = np.zeros(max_wifi_cw + 1, dtype=np.int64)
+        data_airtime_WiFi = np.zeros(wifi_nodes, dtype=np.float64)
+        control_airtime_WiFi = np.zeros_like(data_airtime_WiFi)
+        data_airtime_NR = np.zeros(nru_nodes, dtype=np.float64)
+        control_airtime_NR = np.zeros_like(data_airtime_NR)
 
         # Run multiple simulations with the same node counts but different seeds
         for i in range(0, runs):
@@ -361,7 +361,7 @@ def changing_number_nodes(
                     max_nru_cw,  # Maximum contention window
                     mcot  # Maximum Channel Occupancy Time
                 ),
-                backoff_counts,  # Statistics collection dictionaries
+                backoff_counts,  # Statistics collection arrays
                 data_airtime_WiFi,
                 control_airtime_WiFi,
                 data_airtime_NR,
@@ -1,6 +1,7 @@
 import shutil
 import click
 import csv
+import multiprocessing
 import os
 import pandas as pd
 import numpy as np
@@ -69,11 +70,11 @@ def run_cw_sweep(
                     max_sync_slot_desync, min_sync_slot_desync,
                     3, min_nru_cw, max_nru_cw, 6
                 ),  # NR-U configuration
-                {key: {ap_number: 0} for key in range(cw + 1)},  # Backoff counters
-                {f"WiFiStation {i}": 0 for i in range(1, ap_number + 1)},  # Wi-Fi data airtime
-                {f"WiFiStation {i}": 0 for i in range(1, ap_number + 1)},  # Wi-Fi control airtime
-                {f"NRUBaseStation {i}": 0 for i in range(1, gnb_number + 1)},  # NR-U data airtime
-                {f"NRUBaseStation {i}": 0 for i in range(1, gnb_number + 1)},  # NR-U control airtime
+                np.zeros(cw + 1, dtype=np.int64),  # Backoff counters
+                np.zeros(ap_number, dtype=np.float64),  # Wi-Fi data airtime
+                np.zeros(ap_number, dtype=np.float64),  # Wi-Fi control airtime
+                np.zeros(gnb_number, dtype=np.float64),  # NR-U data airtime
+                np.zeros(gnb_number, dtype=np.float64),  # NR-U control airtime
                 nru_mode,  # NR-U operational mode
                 temp_output_file  # Temporary output file
             )
@@ -285,8 +286,8 @@ def changing_number_nodes(
     # Create output directory if it doesn't exist
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    # Initialize the CSV output file with headers
-    with open(output_path, mode='w', newline='') as out_file:
+    # Open the CSV output file once for the whole sweep (1 MiB buffer) and write the headers
+    with open(output_path, mode='w', newline='', buffering=1 << 20) as out_file:
         writer = csv.writer(out_file)
         writer.writerow([
             "simulation_seed", "wifi_node_count", "nru_node_count",
@@ -295,62 +296,77 @@ def changing_number_nodes(
             "total_channel_occupancy", "total_network_efficiency", "jain's_fairness_index", "joint_airtime_fairness"
         ])
 
-    # Loop through each node count in the specified range
-    for num_nodes in range(start_node_number, end_node_number + 1):
-        print(f"\nProcessing node count: {num_nodes}")
-
-        # In variant mode, dynamically calculate the optimal contention window
-        if is_variant:
-            # Use dynamic calculation based on airtime fairness analysis
-            cw = find_optimal_cw(num_nodes, num_nodes)
-            min_wifi_cw = max_wifi_cw = cw  # Set both min and max to the same value
-            print(f"Using calculated contention window {cw} for {num_nodes} nodes")
-
-        # Initialize statistics tracking dictionaries for this node count
-        backoff_counts = {key: {num_nodes: 0} for key in range(max_wifi_cw + 1)}
-        data_airtime_WiFi = {"WiFiStation {}".format(i): 0 for i in range(1, num_nodes + 1)}
-        control_airtime_WiFi = {"WiFiStation {}".format(i): 0 for i in range(1, num_nodes + 1)}
-        data_airtime_NR = {"NRUBaseStation {}".format(i): 0 for i in range(1, num_nodes + 1)}
-        control_airtime_NR = {"NRUBaseStation {}".format(i): 0 for i in range(1, num_nodes + 1)}
-
-        # Run multiple simulations with the same node count but different seeds
-        for i in range(0, runs):
-            curr_seed = seed + i
-            print(f"Running simulation {i + 1}/{runs} with seed {curr_seed}")
-
-            # Run a single simulation with the current configuration
-            simulate_coexistence(
-                num_nodes,  # Equal number of WiFi and NR-U nodes
-                num_nodes,
-                curr_seed,  # Unique seed for this run
-                simulation_time,
-                WiFiConfig(  # WiFi configuration
-                    1472,  # Data size in bytes
-                    min_wifi_cw,  # Minimum contention window
-                    max_wifi_cw,  # Maximum contention window
-                    wifi_r_limit,  # Retry limit
-                    mcs_value  # Modulation and Coding Scheme
-                ),
-                NRUConfig(  # NR-U configuration
-                    16,  # Prioritization period in μs
-                    9,  # Observation slot duration
-                    synchronization_slot_duration,  # Duration of synchronization slots
-                    max_sync_slot_desync,  # Maximum desynchronization offset
-                    min_sync_slot_desync,  # Minimum desynchronization offset
-                    nru_observation_slot,  # Number of observation slots
-                    min_nru_cw,  # Minimum contention window
-                    max_nru_cw,  # Maximum contention window
-                    mcot  # Maximum Channel Occupancy Time
-                ),
-                backoff_counts,  # Statistics collection dictionaries
-                data_airtime_WiFi,
-                control_airtime_WiFi,
-                data_airtime_NR,
-                control_airtime_NR,
-                nru_mode,  # NR-U operation mode
-                output_path  # Output file path
+        # Every (node count, seed) simulation is independent, so collect them as jobs
+        jobs = []
+        for num_nodes in range(start_node_number, end_node_number + 1):
+            print(f"\nProcessing node count: {num_nodes}")
+
+            # In variant mode, dynamically calculate the optimal contention window
+            if is_variant:
+                # Use dynamic calculation based on airtime fairness analysis
+                cw = find_optimal_cw(num_nodes, num_nodes)
+                min_wifi_cw = max_wifi_cw = cw  # Set both min and max to the same value
+                print(f"Using calculated contention window {cw} for {num_nodes} nodes")
+
+            wifi_config = WiFiConfig(  # WiFi configuration
+                1472,  # Data size in bytes
+                min_wifi_cw,  # Minimum contention window
+                max_wifi_cw,  # Maximum contention window
+                wifi_r_limit,  # Retry limit
+                mcs_value  # Modulation and Coding Scheme
+            )
+            nru_config = NRUConfig(  # NR-U configuration
+                16,  # Prioritization period in μs
+                9,  # Observation slot duration
+                synchronization_slot_duration,  # Duration of synchronization slots
+                max_sync_slot_desync,  # Maximum desynchronization offset
+                min_sync_slot_desync,  # Minimum desynchronization offset
+                nru_observation_slot,  # Number of observation slots
+                min_nru_cw,  # Minimum contention window
+                max_nru_cw,  # Maximum contention window
+                mcot  # Maximum Channel Occupancy Time
             )
 
+            # Run multiple simulations with the same node count but different seeds
+            for i in range(0, runs):
+                curr_seed = seed + i
+                jobs.append((num_nodes, curr_seed, f"Running simulation {i + 1}/{runs} with seed {curr_seed}",
+                             simulation_time, wifi_config, nru_config, nru_mode))
+
+        # Run the simulations across processes; rows are written in job order
+        with multiprocessing.Pool(os.cpu_count()) as pool:
+            for row in pool.imap(_run_one, jobs, chunksize=4):
+                writer.writerow(row)
+
+
+def _run_one(job):
+    """Pool worker: run a single simulation and return its results row"""
+    num_nodes, curr_seed, message, simulation_time, wifi_config, nru_config, nru_mode = job
+    print(message)
+
+    # Initialize statistics tracking arrays for this run
+    backoff_counts = np.zeros(wifi_config.max_cw + 1, dtype=np.int64)
+    data_airtime_WiFi = np.zeros(num_nodes, dtype=np.float64)
+    control_airtime_WiFi = np.zeros_like(data_airtime_WiFi)
+    data_airtime_NR = np.zeros(num_nodes, dtype=np.float64)
+    control_airtime_NR = np.zeros_like(data_airtime_NR)
+
+    return simulate_coexistence(
+        num_nodes,  # Equal number of WiFi and NR-U nodes
+        num_nodes,
+        curr_seed,  # Unique seed for this run
+        simulation_time,
+        wifi_config,
+        nru_config,
+        backoff_counts,  # Statistics collection arrays
+        data_airtime_WiFi,
+        control_airtime_WiFi,
+        data_airtime_NR,
+        control_airtime_NR,
+        nru_mode,  # NR-U operation mode
+        None  # The row is returned and written by the parent process
+    )
+
 
 def build_output_path(
         min_sync_slot_desync: int,
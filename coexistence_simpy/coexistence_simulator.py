@@ -2,9 +2,10 @@ import logging
 import csv
 import os
 import random
+import numpy as np
 import simpy
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import List, Optional
 from .radio_parameters import Times
 
 # --------------------------
@@ -149,11 +150,11 @@ class WirelessMedium:
     tx_lock: simpy.Resource  # Channel access lock
     num_wifi_stations: int  # Number of Wi-Fi stations
     num_nru_nodes: int  # Number of NR-U nodes
-    backoff_counts: Dict[int, Dict[int, int]]  # Track backoff statistics
-    data_airtime_WiFi: Dict[str, int]  # Wi-Fi data transmission airtime per station
-    control_airtime_WiFi: Dict[str, int]  # Wi-Fi control signal airtime per station
-    data_airtime_NR: Dict[str, int]  # NR-U data transmission airtime per node
-    control_airtime_NR: Dict[str, int]  # NR-U control signal airtime per node
+    backoff_counts: np.ndarray  # Track backoff statistics, indexed by backoff slot
+    data_airtime_WiFi: np.ndarray  # Wi-Fi data transmission airtime per station (station id - 1)
+    control_airtime_WiFi: np.ndarray  # Wi-Fi control signal airtime per station
+    data_airtime_NR: np.ndarray  # NR-U data transmission airtime per node (node id - 1)
+    control_airtime_NR: np.ndarray  # NR-U control signal airtime per node
     active_wifi_transmitters: List = field(default_factory=list)  # Active Wi-Fi transmitters
     wifi_stations_in_backoff: List = field(default_factory=list)  # Wi-Fi stations in backoff
     active_nru_transmitters: List = field(default_factory=list)  # Active NR-U transmitters
@@ -183,6 +184,7 @@ class WiFiStation:
         self.config = config
         self.times = Times(config.data_size, config.mcs)  # Calculate timing parameters
         self.name = name
+        self.index = int(name.rsplit(" ", 1)[1]) - 1  # Position in the per-station airtime arrays
         self.env = env
         self.log_color = random.choice(LOG_COLORS)  # Assign random color for logging
         self.frame_to_send = None
@@ -198,8 +200,8 @@ class WiFiStation:
         self.start = 0  # Backoff start time
 
         # Register station in channel statistics
-        self.channel.data_airtime_WiFi.update({name: 0})
-        self.channel.control_airtime_WiFi.update({name: 0})
+        self.channel.data_airtime_WiFi[self.index] = 0
+        self.channel.control_airtime_WiFi[self.index] = 0
         env.process(self.start_process())  # Start the station process
 
     def start_process(self):
@@ -286,7 +288,7 @@ class WiFiStation:
 
                 if was_sent:
                     # If successful, wait for ACK
-                    self.channel.control_airtime_WiFi[self.name] += self.times.get_ack_frame_time()
+                    self.channel.control_airtime_WiFi[self.index] += self.times.get_ack_frame_time()
                     yield self.env.timeout(self.times.get_ack_frame_time())
                     self.clear_transmission_state(res)
                     return True
@@ -357,7 +359,7 @@ class WiFiStation:
         upper_limit = min(upper_limit, self.max_cw)  # Cap at max_cw
         back_off = random.randint(0, upper_limit)  # Select random slot
         # Update statistics
-        self.channel.backoff_counts[back_off][self.channel.num_wifi_stations] += 1
+        self.channel.backoff_counts[back_off] += 1
         return back_off * self.times.t_slot  # Convert slots to time
 
     def generate_wifi_frame(self):
@@ -393,7 +395,7 @@ class WiFiStation:
         self.succeeded_transmissions_WiFi += 1
         self.failed_transmissions_in_row = 0
         self.channel.bytes_sent += self.frame_to_send.data_size
-        self.channel.data_airtime_WiFi[self.name] += self.frame_to_send.frame_time
+        self.channel.data_airtime_WiFi[self.index] += self.frame_to_send.frame_time
         return True
 
 
@@ -415,6 +417,7 @@ class NRUBaseStation:
         """
         self.config_nr = config_nr
         self.name = name
+        self.index = int(name.rsplit(" ", 1)[1]) - 1  # Position in the per-node airtime arrays
         self.env = env
         self.log_color = random.choice(LOG_COLORS)
         self.transmission_to_send = None
@@ -435,8 +438,8 @@ class NRUBaseStation:
         self.start_nr = 0  # Backoff start time
 
         # Register station in channel statistics
-        self.channel.data_airtime_NR.update({name: 0})
-        self.channel.control_airtime_NR.update({name: 0})
+        self.channel.data_airtime_NR[self.index] = 0
+        self.channel.control_airtime_NR[self.index] = 0
 
         # Start main processes
         env.process(self.start_process())
@@ -623,8 +626,8 @@ class NRUBaseStation:
 
                 if was_sent:
                     # Update channel airtime statistics
-                    self.channel.control_airtime_NR[self.name] += self.transmission_to_send.rs_time
-                    self.channel.data_airtime_NR[self.name] += self.transmission_to_send.airtime
+                    self.channel.control_airtime_NR[self.index] += self.transmission_to_send.rs_time
+                    self.channel.data_airtime_NR[self.index] += self.transmission_to_send.airtime
                     self.clear_transmission_state(res)
                     return True
 
@@ -692,7 +695,7 @@ class NRUBaseStation:
         upper_limit = min(upper_limit, self.max_cw)  # Cap at max_cw
         back_off = random.randint(0, upper_limit)  # Select random slot
         # Update statistics
-        self.channel.backoff_counts[back_off][self.channel.num_wifi_stations] += 1
+        self.channel.backoff_counts[back_off] += 1
         return back_off * self.config_nr.observation_slot_duration  # Convert slots to time
 
     def sent_failed(self):
@@ -732,13 +735,13 @@ def simulate_coexistence(
         simulation_time: int,
         config: WiFiConfig,
         configNr: NRUConfig,
-        backoff_counts: Dict[int, Dict[int, int]],
-        data_airtime_WiFi: Dict[str, int],
-        control_airtime_WiFi: Dict[str, int],
-        data_airtime_NR: Dict[str, int],
-        control_airtime_NR: Dict[str, int],
+        backoff_counts: np.ndarray,
+        data_airtime_WiFi: np.ndarray,
+        control_airtime_WiFi: np.ndarray,
+        data_airtime_NR: np.ndarray,
+        control_airtime_NR: np.ndarray,
         nru_mode: str,
-        output_path: str
+        output_path: Optional[str]
 ):
     """Main simulation function for WiFi and NR-U coexistence
 
@@ -752,13 +755,17 @@ def simulate_coexistence(
         simulation_time: Duration of simulation in seconds
         config: WiFi configuration parameters
         configNr: NR-U configuration parameters
-        backoff_counts: Dictionary to track backoff statistics
-        data_airtime_WiFi: Dictionary to track WiFi data transmission airtime
-        control_airtime_WiFi: Dictionary to track WiFi control signal airtime
-        data_airtime_NR: Dictionary to track NR-U data transmission airtime
-        control_airtime_NR: Dictionary to track NR-U control signal airtime
+        backoff_counts: Array counting how often each backoff slot was drawn
+        data_airtime_WiFi: Array of WiFi data transmission airtime, one entry per station
+        control_airtime_WiFi: Array of WiFi control signal airtime, one entry per station
+        data_airtime_NR: Array of NR-U data transmission airtime, one entry per node
+        control_airtime_NR: Array of NR-U control signal airtime, one entry per node
         nru_mode: NR-U operating mode ("gap" or other)
-        output_path: Path to output CSV file for results
+        output_path: Path to output CSV file the results row is appended to, or None
+            to skip file output and only return the row (the caller writes it)
+
+    Returns:
+        list: The results row (same columns as the output CSV)
     """
 
     # --------------------------
@@ -808,27 +815,13 @@ def simulate_coexistence(
             channel.failed_transmissions_NR / (channel.failed_transmissions_NR + channel.succeeded_transmissions_NR))
 
     # Calculate channel occupancy time and efficiency metrics for WiFi
-    channel_occupancy_time_WiFi = 0
-    channel_efficiency_WiFi = 0
-    for i in range(1, number_of_stations + 1):
-        station_key = f"WiFiStation {i}"
-        if station_key in channel.data_airtime_WiFi and station_key in channel.control_airtime_WiFi:
-            # Total airtime is data + control signals
-            channel_occupancy_time_WiFi += channel.data_airtime_WiFi[station_key] + channel.control_airtime_WiFi[
-                station_key]
-            # Efficiency considers only data transmission time
-            channel_efficiency_WiFi += channel.data_airtime_WiFi[station_key]
+    # Total airtime is data + control signals; efficiency considers only data transmission time
+    channel_efficiency_WiFi = float(channel.data_airtime_WiFi[:number_of_stations].sum())
+    channel_occupancy_time_WiFi = channel_efficiency_WiFi + float(channel.control_airtime_WiFi[:number_of_stations].sum())
 
     # Calculate channel occupancy time and efficiency metrics for NR-U
-    channel_occupancy_time_NR = 0
-    channel_efficiency_NR = 0
-    for i in range(1, number_of_gnbs + 1):
-        gnb_key = f"NRUBaseStation {i}"
-        if gnb_key in channel.data_airtime_NR and gnb_key in channel.control_airtime_NR:
-            # Total airtime is data + control signals
-            channel_occupancy_time_NR += channel.data_airtime_NR[gnb_key] + channel.control_airtime_NR[gnb_key]
-            # Efficiency considers only data transmission time
-            channel_efficiency_NR += channel.data_airtime_NR[gnb_key]
+    channel_efficiency_NR = float(channel.data_airtime_NR[:number_of_gnbs].sum())
+    channel_occupancy_time_NR = channel_efficiency_NR + float(channel.control_airtime_NR[:number_of_gnbs].sum())
 
     # Total simulation time in microseconds
     time = simulation_time * 1000000
@@ -859,34 +852,40 @@ def simulate_coexistence(
     print(f'jain_fairness: {fairness:.4f}')
     print(f'airtime_fairness: {joint:.4f}')
 
-    # Write results to output CSV file
-    write_header = not os.path.isfile(output_path)
-    with open(output_path, mode='a', newline="") as result_file:
-        result_adder = csv.writer(result_file)
-
-        # Write header row if the file is new
-        if write_header:
-            result_adder.writerow([
-                "simulation_seed", "wifi_node_count", "nru_node_count",
-                "wifi_channel_occupancy", "wifi_channel_efficiency", "wifi_collision_probability",
-                "nru_channel_occupancy", "nru_channel_efficiency", "nru_collision_probability",
-                "total_channel_occupancy", "total_network_efficiency", "jain's_fairness_index",
-                "joint_airtime_fairness"
-            ])
-
-        # Write simulation results row
-        result_adder.writerow([
-            seed,
-            number_of_stations,
-            number_of_gnbs,
-            normalized_channel_occupancy_time_WiFi,
-            normalized_channel_efficiency_WiFi,
-            p_coll_WiFi,
-            normalized_channel_occupancy_time_NR,
-            normalized_channel_efficiency_NR,
-            p_coll_NR,
-            normalized_channel_occupancy_time_all,
-            normalized_channel_efficiency_all,
-            fairness,
-            joint
-        ])
\ No newline at end of file
+    # Simulation results row
+    row = [
+        seed,
+        number_of_stations,
+        number_of_gnbs,
+        normalized_channel_occupancy_time_WiFi,
+        normalized_channel_efficiency_WiFi,
+        p_coll_WiFi,
+        normalized_channel_occupancy_time_NR,
+        normalized_channel_efficiency_NR,
+        p_coll_NR,
+        normalized_channel_occupancy_time_all,
+        normalized_channel_efficiency_all,
+        fairness,
+        joint
+    ]
+
+    if output_path is not None:
+        # Write results to output CSV file
+        write_header = not os.path.isfile(output_path)
+        with open(output_path, mode='a', newline="") as result_file:
+            result_adder = csv.writer(result_file)
+
+            # Write header row if the file is new
+            if write_header:
+                result_adder.writerow([
+                    "simulation_seed", "wifi_node_count", "nru_node_count",
+                    "wifi_channel_occupancy", "wifi_channel_efficiency", "wifi_collision_probability",
+                    "nru_channel_occupancy", "nru_channel_efficiency", "nru_collision_probability",
+                    "total_channel_occupancy", "total_network_efficiency", "jain's_fairness_index",
+                    "joint_airtime_fairness"
+                ])
+
+            # Write simulation results row
+            result_adder.writerow(row)
+
+    return row
@@ -1,6 +1,7 @@
 import click
 import csv
 import os
+import numpy as np
 from coexistence_simpy.coexistence_simulator import *
 
 
@@ -84,11 +85,11 @@ def cw_sweep_simulation(
                 NRUConfig(16, 9, synchronization_slot_duration,
                           max_sync_slot_desync, min_sync_slot_desync,
                           3, min_nru_cw, max_nru_cw, 6),  # NR-U configuration
-                {key: {ap_number: 0} for key in range(cw + 1)},  # Backoff counters
-                {f"WiFiStation {i}": 0 for i in range(1, ap_number + 1)},  # Wi-Fi data airtime
-                {f"WiFiStation {i}": 0 for i in range(1, ap_number + 1)},  # Wi-Fi control airtime
-                {f"NRUBaseStation {i}": 0 for i in range(1, gnb_number + 1)},  # NR-U data airtime
-                {f"NRUBaseStation {i}": 0 for i in range(1, gnb_number + 1)},  # NR-U control airtime
+                np.zeros(cw + 1, dtype=np.int64),  # Backoff counters
+                np.zeros(ap_number, dtype=np.float64),  # Wi-Fi data airtime
+                np.zeros(ap_number, dtype=np.float64),  # Wi-Fi control airtime
+                np.zeros(gnb_number, dtype=np.float64),  # NR-U data airtime
+                np.zeros(gnb_number, dtype=np.float64),  # NR-U control airtime
                 nru_mode,  # NR-U operational mode
                 TEMP_OUTPUT_FILE  # Temporary output file
             )
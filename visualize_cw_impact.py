@@ -1,12 +1,30 @@
 import os
 import glob
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import matplotlib
+
+# Only PNGs are written, so default to the non-interactive backend (this also
+# lets worker processes render without a display). An explicit MPLBACKEND wins.
+if not os.environ.get('MPLBACKEND'):
+    matplotlib.use('Agg', force=True)
+
+# Cheaper rasterization of line paths for batch plotting
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import matplotlib as mpl
 from cycler import cycler
-import re
 import warnings
+import argparse
+
+# Fast zlib level for PNG output: roughly a third of the compression CPU
+# for ~10% larger files (PNG is lossless, so image quality is unchanged)
+PNG_SAVE_OPTIONS = {'optimize': False, 'compress_level': 1}
 
 def set_distinct_color_palette():
     """
@@ -29,26 +47,26 @@ def set_distinct_color_palette():
     return distinct_colors
 
 
-def extract_parameters(filename):
-    """Extract parameters from filename"""
-    # Example: airtime_fairness_nru-5_wifi-10.csv
-    match = re.search(r"airtime_fairness_nru-(\d+)_wifi-(\d+)", filename)
-    if match:
-        return f"NR-U: {match.group(1)}, Wi-Fi: {match.group(2)}"
-    return "unknown"
-
+def create_plot(df, x_col, y_cols, labels, title, xlabel, ylabel, output_path, ylim=(0, 1), show_plot=False,
+                skip_mkdir=False, dpi=None):
+    """
+    Create and save a plot with given data and parameters
 
-def create_plot(df, x_col, y_cols, labels, title, xlabel, ylabel, output_path, ylim=(0, 1), show_plot=False):
-    """Create and save a plot with given data and parameters"""
-    fig, ax = plt.subplots()
+    Pass skip_mkdir=True when the caller has already created the output directory.
+    dpi=None keeps Matplotlib's default savefig resolution.
+    """
+    # Constrained layout is solved during the save, replacing a separate tight_layout pass
+    fig, ax = plt.subplots(layout='constrained')
 
     # Group by x_col and calculate mean values for each y_col
     grouped_data = [df.groupby([x_col])[y_col].mean() for y_col in y_cols]
 
-    # Plot each data series
+    # Plot each data series straight from float32 arrays
     for i, (data, label) in enumerate(zip(grouped_data, labels)):
         linestyle = '-' if i % 2 == 0 else '--'
-        data.plot(marker="o", linestyle=linestyle, label=label, ax=ax) if i % 2 == 0 else data.plot(marker="s", linestyle=linestyle, label=label, ax=ax)
+        marker = "o" if i % 2 == 0 else "s"
+        ax.plot(data.index.to_numpy(), data.to_numpy(dtype=np.float32),
+                marker=marker, linestyle=linestyle, label=label)
 
     ax.set_ylim(*ylim)
     ax.legend(loc = 'best', fontsize=15)
@@ -56,14 +74,14 @@ def create_plot(df, x_col, y_cols, labels, title, xlabel, ylabel, output_path, y
     ax.set_ylabel(ylabel, fontsize=20)
     ax.grid(True, linestyle='--', alpha=0.7)
     # ax.set_title(title, fontsize=14)
-    plt.tight_layout()
 
     # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    if not skip_mkdir:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
     # Save the plot
     # plt.show()
-    plt.savefig(output_path)
+    fig.savefig(output_path, dpi=dpi, pil_kwargs=PNG_SAVE_OPTIONS)
     print(f"  Saved plot: {output_path}")
 
     if show_plot:
@@ -72,9 +90,48 @@ def create_plot(df, x_col, y_cols, labels, title, xlabel, ylabel, output_path, y
     plt.close(fig)
     return output_path
 
+def _process_one_csv(csv_file, output_dir, show_plots=False, dpi=None):
+    """Create the channel occupancy plot for a single CSV file (runs in a worker process)"""
+    try:
+        # Extract base filename for plot naming
+        base_filename = os.path.splitext(os.path.basename(csv_file))[0]
+        print(f"\nProcessing file: {base_filename}.csv")
+
+        # Generate plot name for Channel Occupancy
+        cot_output = os.path.join(output_dir, f"{base_filename}.png")
+
+        # Read CSV into DataFrame
+        df = pd.read_csv(csv_file)
+        # print(f"  Loaded data with {len(df)} rows and {len(df.columns)} columns")
+
+        # float32 is plenty for plotting and halves the bytes the groupby has to touch
+        float_cols = df.select_dtypes('float64').columns
+        df[float_cols] = df[float_cols].astype('float32')
+
+        # Create Channel Occupancy plot
+        return create_plot(
+            df=df,
+            x_col='CW',
+            y_cols=['wifi_channel_occupancy', 'nru_channel_occupancy'],
+            labels=['Wi-Fi', 'NR-U'],
+            title='Channel Occupancy vs Contention Window Size',
+            xlabel='Wi-Fi Contention Window',
+            ylabel='Channel Occupancy',
+            output_path=cot_output,
+            ylim=(0, 1),
+            show_plot=show_plots,
+            skip_mkdir=True,  # output_dir is created once by process_equal_airtime_data
+            dpi=dpi
+        )
+
+    except Exception as e:
+        warnings.warn(f"Error processing file {csv_file}: {str(e)}")
+        return None
+
+
 def process_equal_airtime_data(csv_pattern="output/simulation_results/airtime_fairness*.csv",
                                output_dir="output/metrics_visualizations/airtime_fairness",
-                               show_plots=False):
+                               show_plots=False, dpi=None):
     """Process equal airtime data from CSV files and create plots"""
     print("\n=== Starting Equal Airtime Metrics Visualization Process ===\n")
 
@@ -90,48 +147,25 @@ def process_equal_airtime_data(csv_pattern="output/simulation_results/airtime_fa
 
     print(f"Found {len(simulation_results)} CSV files to process:")
     for i, file_path in enumerate(simulation_results):
-        params = extract_parameters(os.path.basename(file_path))
         print(f"{i + 1}. {os.path.basename(file_path)}")
 
-    results = []
-
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     print(f"\nOutput directory created: {output_dir}")
 
     print("\nGenerating channel cccupancy plots for equal airtime data:")
 
-    for csv_file in simulation_results:
-        try:
-            # Extract base filename for plot naming
-            base_filename = os.path.splitext(os.path.basename(csv_file))[0]
-            params = extract_parameters(os.path.basename(csv_file))
-            print(f"\nProcessing file: {base_filename}.csv")
-
-            # Generate plot name for Channel Occupancy
-            cot_output = os.path.join(output_dir, f"{base_filename}.png")
-
-            # Read CSV into DataFrame
-            df = pd.read_csv(csv_file)
-            # print(f"  Loaded data with {len(df)} rows and {len(df.columns)} columns")
-
-            # Create Channel Occupancy plot
-            saved_path = create_plot(
-                df=df,
-                x_col='CW',
-                y_cols=['wifi_channel_occupancy', 'nru_channel_occupancy'],
-                labels=['Wi-Fi', 'NR-U'],
-                title='Channel Occupancy vs Contention Window Size',
-                xlabel='Wi-Fi Contention Window',
-                ylabel='Channel Occupancy',
-                output_path=cot_output,
-                ylim=(0, 1),
-                show_plot=show_plots
-            )
-            results.append(saved_path)
-
-        except Exception as e:
-            warnings.warn(f"Error processing file {csv_file}: {str(e)}")
+    if show_plots:
+        # Interactive display has to happen in this process, so keep it serial
+        saved_paths = [_process_one_csv(csv_file, output_dir, show_plots, dpi) for csv_file in simulation_results]
+    else:
+        # Every file is independent, so render them in parallel worker processes
+        max_workers = min(len(simulation_results), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=set_distinct_color_palette) as executor:
+            saved_paths = list(executor.map(_process_one_csv, simulation_results,
+                                            repeat(output_dir), repeat(show_plots), repeat(dpi)))
+
+    results = [path for path in saved_paths if path is not None]
 
     # Print summary of generated files
     print("\n=== Summary of Generated Output Files ===")
@@ -142,7 +176,12 @@ def process_equal_airtime_data(csv_pattern="output/simulation_results/airtime_fa
 
 def main():
     """Main function to run the script"""
-    process_equal_airtime_data()
+    parser = argparse.ArgumentParser(description='Plot channel occupancy against Wi-Fi contention window size')
+    parser.add_argument('--dpi', type=int, default=None,
+                        help='Resolution of the saved plots (default: Matplotlib default)')
+    args = parser.parse_args()
+
+    process_equal_airtime_data(dpi=args.dpi)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,54 @@
+import os
+import matplotlib
+
+# Only PNGs are written, so default to the non-interactive Agg backend and
+# skip GUI toolkit start-up. An explicit MPLBACKEND wins.
+if not os.environ.get('MPLBACKEND'):
+    matplotlib.use('Agg')
+
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
-import os
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import argparse
 import glob
 import re
 import itertools
+import functools
+import mmap
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from cycler import cycler
 
-
-def set_plot_style():
-    """Set consistent plot style for all visualizations"""
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    # pyarrow is optional; pandas' C parser is used without it
+    pa = pacsv = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; the group means fall back to NumPy bincount
+    njit = None
+
+
+# Colorblind-friendly palette (the same colors as in visualize_network_metrics.py)
+_PALETTE = [
+    '#0072B2',  # blue
+    '#D55E00',  # vermillion/orange
+    '#009E73',  # green
+    '#E69F00',  # orange/amber
+    '#56B4E9',  # sky blue
+    '#F0E442',  # yellow
+    '#000000',  # black
+]
+
+
+def _apply_rc_once():
+    """Set consistent plot style for all visualizations (global rcParams, so apply once from main)"""
     plt.rcParams.update({
         'font.size': 16,  # Increased base font size
         'axes.labelsize': 18,  # Increased label font size
@@ -18,54 +56,376 @@ def set_plot_style():
         'xtick.labelsize': 16,  # Increased tick label font size
         'ytick.labelsize': 16,  # Increased tick label font size
         'legend.fontsize': 15,  # Increased legend font size
+        'axes.prop_cycle': cycler('color', _PALETTE),
     })
 
-    # Define a colorblind-friendly palette
-    distinct_colors = [
-        '#0072B2',  # blue
-        '#D55E00',  # vermillion/orange
-        '#009E73',  # green
-        '#E69F00',  # orange/amber
-        '#56B4E9',  # sky blue
-        '#F0E442',  # yellow
-        '#000000',  # black
-    ]
-    plt.rcParams['axes.prop_cycle'] = cycler('color', distinct_colors)
 
-    # Return colors in case needed elsewhere
-    return distinct_colors
+# Filename patterns, compiled once at import
+_EXCLUDE_RE = re.compile(r'airtime_fairness|coex_gap-mode_desync-0-1000_disabled-backoff_adjusted-cw-\d+_raw-data')
+_DESYNC_RE = re.compile(r'desync-(\d+-\d+)')
+_ADJUSTED_CW_RE = re.compile(r'adjusted-cw-(\d+)')
+
+REQUIRED_COLUMNS = ["wifi_node_count", "jain's_fairness_index", "joint_airtime_fairness"]
+REQUIRED_DTYPES = {
+    "wifi_node_count": "int32",
+    "jain's_fairness_index": "float32",
+    "joint_airtime_fairness": "float32",
+}
+
+# CSVs larger than this are reduced chunk by chunk instead of loaded whole
+LARGE_CSV_BYTES = 64 * 1024 * 1024
+CSV_CHUNK_ROWS = 1_000_000
+
+
+def _parquet_path(csv_path):
+    """Path of the columnar Parquet cache kept next to a CSV file"""
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def _parquet_is_fresh(csv_path, parquet_path):
+    """True if the Parquet cache exists and is at least as new as its CSV"""
+    return (os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path))
+
+
+def _ensure_parquet(csv_path):
+    """
+    Write (or refresh) the Parquet sibling of a CSV file so later runs can
+    skip text parsing. Requires pyarrow or fastparquet.
+    """
+    parquet_path = _parquet_path(csv_path)
+    if not _parquet_is_fresh(csv_path, parquet_path):
+        pd.read_csv(csv_path).to_parquet(parquet_path, compression='zstd')
+    return parquet_path
+
+
+def read_fairness_arrays(csv_file):
+    """
+    Read only the fairness columns of a simulation CSV as NumPy arrays.
+    Prefers an up-to-date Parquet cache (see _ensure_parquet); otherwise uses
+    pyarrow's multithreaded CSV reader when installed, pandas' C parser if not.
+    Returns (node_counts, jfi, jaf) arrays in REQUIRED_DTYPES.
+    Raises ValueError/KeyError if the file lacks any of the required columns.
+    """
+    parquet_path = _parquet_path(csv_file)
+    if _parquet_is_fresh(csv_file, parquet_path):
+        df = pd.read_parquet(parquet_path, columns=REQUIRED_COLUMNS).astype(REQUIRED_DTYPES)
+        return tuple(df[column].to_numpy() for column in REQUIRED_COLUMNS)
+
+    if pacsv is not None:
+        # Arrow columns convert straight to NumPy without building a DataFrame
+        table = pacsv.read_csv(csv_file, convert_options=pacsv.ConvertOptions(
+            include_columns=REQUIRED_COLUMNS,
+            column_types={column: pa.from_numpy_dtype(np.dtype(dtype))
+                          for column, dtype in REQUIRED_DTYPES.items()}))
+        return tuple(table.column(column).to_numpy() for column in REQUIRED_COLUMNS)
+
+    df = pd.read_csv(csv_file, engine='c', usecols=REQUIRED_COLUMNS, dtype=REQUIRED_DTYPES)
+    return tuple(df[column].to_numpy() for column in REQUIRED_COLUMNS)
+
+
+def _sum_by_key(keys, v1, v2, size):
+    """Per-key counts and sums of v1 and v2, in a single pass over the data"""
+    counts = np.zeros(size)
+    s1 = np.zeros(size)
+    s2 = np.zeros(size)
+    for i in range(keys.shape[0]):
+        k = keys[i]
+        counts[k] += 1
+        s1[k] += v1[i]
+        s2[k] += v2[i]
+    return counts, s1, s2
+
+
+if njit is not None:
+    _sum_by_key = njit(cache=True)(_sum_by_key)
+
+
+def _mean_by_key(keys, v1, v2):
+    """
+    Average v1 and v2 per non-negative integer key.
+    Uses the JIT-compiled single-pass kernel when numba is installed,
+    NumPy bincount (one pass per array) otherwise.
+    Returns (present keys in ascending order, v1 means, v2 means).
+    """
+    if njit is not None and len(keys):
+        counts, s1, s2 = _sum_by_key(keys, v1, v2, int(keys.max()) + 1)
+    else:
+        counts = np.bincount(keys)
+        s1 = np.bincount(keys, weights=v1)
+        s2 = np.bincount(keys, weights=v2)
+    present = counts > 0
+    return np.nonzero(present)[0], s1[present] / counts[present], s2[present] / counts[present]
+
+
+def _padded(arr, size):
+    """Zero-extend a 1-D array to size elements"""
+    return np.pad(arr, (0, size - len(arr)))
+
+
+def _stream_fairness_averages(csv_file):
+    """
+    Average the fairness metrics per node count while reading the CSV in
+    chunks, folding each chunk into running bincount sums so memory stays
+    bounded by the chunk size. Returns the same tuple as load_fairness_averages.
+    """
+    counts = jfi_sums = jaf_sums = np.zeros(0)
+    for chunk in pd.read_csv(csv_file, engine='c', usecols=REQUIRED_COLUMNS,
+                             dtype=REQUIRED_DTYPES, chunksize=CSV_CHUNK_ROWS):
+        keys = chunk['wifi_node_count'].to_numpy()
+        size = max(len(counts), int(keys.max()) + 1)
+        counts = _padded(counts, size) + np.bincount(keys, minlength=size)
+        jfi_sums = _padded(jfi_sums, size) + np.bincount(
+            keys, weights=chunk["jain's_fairness_index"].to_numpy(), minlength=size)
+        jaf_sums = _padded(jaf_sums, size) + np.bincount(
+            keys, weights=chunk["joint_airtime_fairness"].to_numpy(), minlength=size)
+
+    present = counts > 0
+    return (np.nonzero(present)[0], jfi_sums[present] / counts[present],
+            jaf_sums[present] / counts[present])
+
+
+# Node counts the --fast-parse kernel accumulates; larger keys use the regular readers
+FAST_PARSE_MAX_KEY = 4096
+
+
+def _parse_number(buf, i, j):
+    """
+    Parse the ASCII decimal number (optionally signed, with exponent) in buf[i:j].
+    Returns (value, ok); ok is False for anything else (empty, quoted, nan, ...).
+    """
+    negative = False
+    if i < j and (buf[i] == 45 or buf[i] == 43):  # '-' or '+'
+        negative = buf[i] == 45
+        i += 1
+
+    mantissa = 0
+    significant = 0
+    scale = 0
+    any_digit = False
+    seen_dot = False
+    while i < j:
+        c = buf[i]
+        if 48 <= c <= 57:  # '0'-'9'
+            any_digit = True
+            if significant < 18:
+                mantissa = mantissa * 10 + (c - 48)
+                if mantissa > 0:
+                    significant += 1
+                if seen_dot:
+                    scale -= 1
+            elif not seen_dot:
+                # Digits beyond int64 precision only shift the magnitude
+                scale += 1
+        elif c == 46 and not seen_dot:  # '.'
+            seen_dot = True
+        elif c == 101 or c == 69:  # 'e' or 'E'
+            break
+        else:
+            return 0.0, False
+        i += 1
+    if not any_digit:
+        return 0.0, False
+
+    if i < j:
+        i += 1
+        exp_negative = False
+        if i < j and (buf[i] == 45 or buf[i] == 43):
+            exp_negative = buf[i] == 45
+            i += 1
+        if i == j:
+            return 0.0, False
+        exponent = 0
+        while i < j:
+            c = buf[i]
+            if c < 48 or c > 57:
+                return 0.0, False
+            exponent = exponent * 10 + (c - 48)
+            i += 1
+        scale += -exponent if exp_negative else exponent
+
+    value = float(mantissa)
+    if scale < 0:
+        value /= 10.0 ** (-scale)
+    elif scale > 0:
+        value *= 10.0 ** scale
+    return (-value if negative else value), True
+
+
+def _parse_and_reduce(buf, start, key_col, jfi_col, jaf_col, size):
+    """
+    Scan the CSV bytes in buf from offset start, parse only the node count,
+    JFI and JAF fields of each row and accumulate per-node-count counts and sums.
+    Returns (counts, jfi_sums, jaf_sums, ok); ok is False if a row could not be
+    handled (missing or non-numeric field, key outside 0..size-1).
+    """
+    counts = np.zeros(size)
+    jfi_sums = np.zeros(size)
+    jaf_sums = np.zeros(size)
+    n = buf.shape[0]
+    i = start
+    while i < n:
+        col = 0
+        found = 0
+        key = 0
+        jfi = 0.0
+        jaf = 0.0
+        while True:
+            j = i
+            while j < n and buf[j] != 44 and buf[j] != 10 and buf[j] != 13:  # ',', '\n', '\r'
+                j += 1
+            if col == key_col or col == jfi_col or col == jaf_col:
+                value, ok = _parse_number(buf, i, j)
+                if not ok:
+                    return counts, jfi_sums, jaf_sums, False
+                found += 1
+                if col == key_col:
+                    key = int(value)
+                    if key != value or key < 0 or key >= size:
+                        return counts, jfi_sums, jaf_sums, False
+                elif col == jfi_col:
+                    jfi = value
+                else:
+                    jaf = value
+            col += 1
+            if j >= n or buf[j] != 44:
+                break
+            i = j + 1
+
+        # Step over the line terminator(s); blank lines are skipped
+        while j < n and (buf[j] == 10 or buf[j] == 13):
+            j += 1
+        i = j
+        if found == 0 and col == 1:
+            continue
+        if found != 3:
+            return counts, jfi_sums, jaf_sums, False
+
+        counts[key] += 1
+        jfi_sums[key] += jfi
+        jaf_sums[key] += jaf
+    return counts, jfi_sums, jaf_sums, True
+
+
+if njit is not None:
+    _parse_number = njit(cache=True)(_parse_number)
+    _parse_and_reduce = njit(cache=True)(_parse_and_reduce)
+
+
+def _fast_fairness_averages(csv_file):
+    """
+    --fast-parse path: memory-map the CSV and reduce it with the JIT-compiled
+    _parse_and_reduce kernel, without building any DataFrame.
+    Returns the same tuple as load_fairness_averages, or None if the file
+    needs the regular readers instead.
+    """
+    with open(csv_file, 'rb') as f:
+        header = f.readline()
+        columns = header.decode('utf-8', errors='replace').rstrip('\r\n').split(',')
+        if any(column not in columns for column in REQUIRED_COLUMNS):
+            return None
+        if os.fstat(f.fileno()).st_size <= len(header):
+            return None
+        key_col, jfi_col, jaf_col = (columns.index(column) for column in REQUIRED_COLUMNS)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            counts, jfi_sums, jaf_sums, ok = _parse_and_reduce(
+                buf, len(header), key_col, jfi_col, jaf_col, FAST_PARSE_MAX_KEY)
+            # Release the buffer export before the map is closed
+            del buf
+
+    if not ok:
+        return None
+    present = counts > 0
+    return (np.nonzero(present)[0], jfi_sums[present] / counts[present],
+            jaf_sums[present] / counts[present])
+
+
+def load_fairness_averages(csv_file, fast_parse=False):
+    """
+    Load a simulation CSV and average the fairness metrics per node count.
+    Returns a (node_counts, jfi_means, jaf_means) tuple of NumPy arrays,
+    or None if the file lacks the required columns.
+    With fast_parse (and numba installed) the JIT-compiled byte parser is
+    tried first, unless a fresh Parquet cache exists.
+    """
+    if (fast_parse and njit is not None
+            and not _parquet_is_fresh(csv_file, _parquet_path(csv_file))):
+        averages = _fast_fairness_averages(csv_file)
+        if averages is not None:
+            return averages
+
+    try:
+        if (os.path.getsize(csv_file) > LARGE_CSV_BYTES
+                and not _parquet_is_fresh(csv_file, _parquet_path(csv_file))):
+            return _stream_fairness_averages(csv_file)
+        keys, jfi, jaf = read_fairness_arrays(csv_file)
+    except (ValueError, KeyError):
+        # The column selection rejects files without the required columns
+        return None
+
+    # Node counts are small integers, so an array reduction replaces the groupby
+    return _mean_by_key(keys, jfi, jaf)
+
+
+def _load_reduce(csv_file, fast_parse=False):
+    """Worker for _load_and_reduce: returns (path, averaged data or None)"""
+    try:
+        return csv_file, load_fairness_averages(csv_file, fast_parse)
+    except Exception as e:
+        print(f"  Error loading {csv_file}: {e}")
+        return csv_file, None
+
+
+def _load_and_reduce(paths, fast_parse=False):
+    """
+    Parse each CSV once and reduce it to per-node-count fairness averages
+    (see load_fairness_averages),
+    so the consolidated, individual and category plots can share the result.
+    Files are independent, so they are loaded in parallel worker processes.
+    Files that fail to load or lack the required columns are left out
+    (the plot functions report them as skipped).
+    """
+    if not paths:
+        return {}
+
+    max_workers = min(len(paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_load_reduce, paths, itertools.repeat(fast_parse))
+        return {csv_file: averages for csv_file, averages in results if averages is not None}
+
+
+def _get_fairness_averages(csv_file, precomputed=None):
+    """Return the averaged fairness data for a file, from precomputed results when available"""
+    if precomputed is not None:
+        return precomputed.get(csv_file)
+    return load_fairness_averages(csv_file)
 
 
 def should_include_file(filename):
     """Determine if this file should be included in the analysis"""
-    # Skip files with airtime_fairness or matching specific pattern
-    if "airtime_fairness" in filename:
-        return False
-    if re.search(r'coex_gap-mode_desync-0-1000_disabled-backoff_adjusted-cw-\d+_raw-data', filename):
-        return False
+    # Skip files with airtime_fairness or matching the fixed adjusted-CW pattern;
+    # everything else (including Varied_raw-data.csv files) is included
+    return _EXCLUDE_RE.search(filename) is None
 
-    # Include files with Varied_raw-data.csv
-    if "Varied_raw-data.csv" in filename:
-        return True
 
-    # Include all other files that don't match exclusion patterns
-    return True
+# Legend names for specific filenames (special cases for get_custom_legend)
+_SPECIFIC_MAPPINGS = {
+    'coex_gap-mode_raw-data': 'NR-U Default Gap Mode',
+    'coex_rs-mode_raw-data': 'NR-U RS Mode',
+    'coex_gap-mode_desync-0-1000_raw-data': 'NR-U Default Gap Mode: Desync',
+    'coex_gap-mode_desync-0-1000_disabled-backoff_raw-data': 'NR-U Default Gap Mode: Desync, no Backoff',
+    'coex_gap-mode_desync-0-1000_disabled-backoff_dynamic-cw_raw-data': 'NR-U Optimized Gap Mode: adj.CW'
+}
 
 
+@functools.lru_cache(maxsize=None)
 def get_custom_legend(file_basename):
-    """Extract a custom legend name from the filename"""
-    # Special cases for specific filenames
-    specific_mappings = {
-        'coex_gap-mode_raw-data': 'NR-U Default Gap Mode',
-        'coex_rs-mode_raw-data': 'NR-U RS Mode',
-        'coex_gap-mode_desync-0-1000_raw-data': 'NR-U Default Gap Mode: Desync',
-        'coex_gap-mode_desync-0-1000_disabled-backoff_raw-data': 'NR-U Default Gap Mode: Desync, no Backoff',
-        'coex_gap-mode_desync-0-1000_disabled-backoff_dynamic-cw_raw-data': 'NR-U Optimized Gap Mode: adj.CW'
-    }
-
+    """Extract a custom legend name from the filename (cached, as every plot pass asks for the same names)"""
     # Check if this is one of our specific mappings
-    if file_basename in specific_mappings:
-        return specific_mappings[file_basename]
+    if file_basename in _SPECIFIC_MAPPINGS:
+        return _SPECIFIC_MAPPINGS[file_basename]
 
     # If not a specific mapping, use the generic approach
     parts = []
@@ -76,16 +436,16 @@ def get_custom_legend(file_basename):
     else:
         parts.append('NR-U')
 
-    if 'desync' in file_basename and re.search(r'desync-(\d+-\d+)', file_basename):
-        desync_value = re.search(r'desync-(\d+-\d+)', file_basename).group(1)
-        parts.append(f"Desync {desync_value}")
+    desync_match = _DESYNC_RE.search(file_basename) if 'desync' in file_basename else None
+    if desync_match:
+        parts.append(f"Desync {desync_match.group(1)}")
 
     if 'disabled-backoff' in file_basename:
         parts.append("no Backoff")
 
-    if 'adjusted-cw' in file_basename and re.search(r'adjusted-cw-(\d+)', file_basename):
-        cw_value = re.search(r'adjusted-cw-(\d+)', file_basename).group(1)
-        parts.append(f"adj.CW {cw_value}")
+    cw_match = _ADJUSTED_CW_RE.search(file_basename) if 'adjusted-cw' in file_basename else None
+    if cw_match:
+        parts.append(f"adj.CW {cw_match.group(1)}")
     elif 'adjusted-cw-Varied' in file_basename:
         parts.append("adj.CW")
     elif 'dynamic-cw' in file_basename:
@@ -97,11 +457,33 @@ def get_custom_legend(file_basename):
         return file_basename.replace('coex_', '').replace('_raw-data', '')
 
 
+# Output directories already created during this run
+_DIRS_CREATED = set()
+
+
+def _makedirs_once(path):
+    """os.makedirs(path, exist_ok=True), skipped for directories created earlier in this run"""
+    if path not in _DIRS_CREATED:
+        os.makedirs(path, exist_ok=True)
+        _DIRS_CREATED.add(path)
+
+
 def create_fairness_plot(x_data, y_data, title, xlabel, ylabel, output_path, ylim=(0, 1), marker='o', linestyle='-',
-                         color='blue', legend_title=None):
-    """Create and save a plot with given data and parameters"""
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.plot(x_data, y_data, marker=marker, linestyle=linestyle, color=color, linewidth=2)
+                         color='blue', legend_title=None, ax=None):
+    """
+    Create and save a plot with given data and parameters
+    Pass ax to draw on a reused axis (it is cleared first and left open for the caller);
+    otherwise a new figure is created and closed after saving.
+    """
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(10, 6))
+        owns_figure = True
+    else:
+        fig = ax.figure
+        ax.clear()
+        owns_figure = False
+
+    ax.plot(x_data, y_data, marker=marker, linestyle=linestyle, color=color, linewidth=2, rasterized=True)
 
     if legend_title:
         ax.legend([legend_title], loc='best', frameon=True, shadow=True, fontsize=15)
@@ -113,27 +495,135 @@ def create_fairness_plot(x_data, y_data, title, xlabel, ylabel, output_path, yli
     ax.grid(True, linestyle='--', alpha=0.7)  # Added grid with dashed lines
     ax.tick_params(axis='both', which='major', labelsize=16)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Create output directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    _makedirs_once(os.path.dirname(output_path))
 
-    plt.savefig(output_path)
+    fig.savefig(output_path)
     print(f"  Saved plot: {output_path}")
     # plt.show()
-    plt.close(fig)
+    if owns_figure:
+        plt.close(fig)
+
+
+def _draw_series_collection(ax, series):
+    """
+    Draw many (x, y, linestyle, marker, color, label) series on ax as a single
+    LineCollection plus one scatter per marker style, instead of one Line2D each.
+    Returns proxy handles for the legend.
+    """
+    if not series:
+        return []
+
+    segments = [np.column_stack([x, y]) for x, y, _, _, _, _ in series]
+    ax.add_collection(LineCollection(segments, colors=[color for *_, color, _ in series],
+                                     linestyles=[style for _, _, style, *_ in series],
+                                     linewidths=2, rasterized=True))
+
+    # Group the points by marker style so each style is one scatter artist
+    by_marker = {}
+    for x, y, _, marker, color, _ in series:
+        xs, ys, point_colors = by_marker.setdefault(marker, ([], [], []))
+        xs.append(x)
+        ys.append(y)
+        point_colors.extend([color] * len(x))
+    for marker, (xs, ys, point_colors) in by_marker.items():
+        ax.scatter(np.concatenate(xs), np.concatenate(ys), c=point_colors, marker=marker,
+                   s=plt.rcParams['lines.markersize'] ** 2, zorder=3, rasterized=True)
+
+    ax.autoscale_view()
+
+    return [Line2D([], [], linestyle=style, marker=marker, color=color, linewidth=2, label=label)
+            for _, _, style, marker, color, label in series]
+
+
+# Line styles, markers and colors cycled through the series of a comparison plot
+_LINE_STYLES = ['-', '--', '-.', ':']
+_MARKERS = ['o', 's', '^', 'D', 'v', '*', 'x', '+']
+
+_METRIC_LABELS = ("Jain's Fairness Index", "Joint Airtime Fairness")
+
+
+def _fairness_series(csv_files, precomputed=None, indent='  ', report_skipped=True, context=''):
+    """
+    Yield one (node_counts, jfi_avg, jaf_avg, linestyle, marker, color, label)
+    tuple per CSV file, cycling through the line styles, markers and colors.
+    """
+    style_cycler = itertools.cycle(_LINE_STYLES)
+    marker_cycler = itertools.cycle(_MARKERS)
+    color_cycler = itertools.cycle(_PALETTE)  # Use the same colors as in visualize_network_metrics.py
+
+    for csv_file in csv_files:
+        try:
+            # Get a short name for the legend
+            file_basename = os.path.basename(csv_file).replace('.csv', '')
+            custom_legend = get_custom_legend(file_basename)
+
+            # Get next style, marker and color
+            line_style = next(style_cycler)
+            marker = next(marker_cycler)
+            color = next(color_cycler)
+
+            # Load the averaged data
+            print(f"{indent}Processing {os.path.basename(csv_file)}")
+            averages = _get_fairness_averages(csv_file, precomputed)
+            if averages is None:
+                if report_skipped:
+                    print(f"{indent}Warning: Required columns not found in {csv_file}. Skipping.")
+                continue
+            node_counts, jfi_avg, jaf_avg = averages
+
+            yield node_counts, jfi_avg, jaf_avg, line_style, marker, color, custom_legend
+
+        except Exception as e:
+            print(f"{indent}Error processing {csv_file}{context}: {e}")
+
+
+def _render_series_group(figures, series_iter, titles, ylims, output_paths, dpi=150):
+    """
+    Draw one group of fairness series on a (JFI, JAF) pair of (fig, ax) and save both.
+    The axes are cleared first so the same figures can be reused across groups.
+    titles, ylims and output_paths are (JFI, JAF) pairs; a None title or ylim is left unset.
+    """
+    jfi_series, jaf_series = [], []
+    for x, y_jfi, y_jaf, line_style, marker, color, label in series_iter:
+        jfi_series.append((x, y_jfi, line_style, marker, color, label))
+        jaf_series.append((x, y_jaf, line_style, marker, color, label))
+
+    for (fig, ax), series, title, ylabel, ylim, output_path in zip(
+            figures, (jfi_series, jaf_series), titles, _METRIC_LABELS, ylims, output_paths):
+        ax.clear()
+        if title is not None:
+            ax.set_title(title, fontsize=20)
+        ax.set_xlabel('Number of WiFi/NRU Nodes', fontsize=20)
+        ax.set_ylabel(ylabel, fontsize=20)
+        ax.grid(True, linestyle='--', alpha=0.7)  # Added grid with dashed lines
+        if ylim is not None:
+            ax.set_ylim(ylim)
+        ax.tick_params(axis='both', which='major', labelsize=16)
+
+        # Draw all series at once, then finalize and save the plot
+        handles = _draw_series_collection(ax, series)
+        ax.legend(handles=handles, loc='best', frameon=True, shadow=True, fontsize=15)
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=dpi)
 
 
 def plot_consolidated_fairness(                               input_dir='output/simulation_results',
-                               output_dir='output/metrics_visualizations/fairness_plots/consolidated'
+                               output_dir='output/metrics_visualizations/fairness_plots/consolidated',
+                               precomputed=None,
+                               dpi=150
                               ):
     """
     Create consolidated plots for Jain's fairness index and joint airtime fairness
     from multiple CSV files, with each file represented as a separate line.
+    precomputed optionally maps CSV paths to their averaged arrays (see _load_and_reduce).
+    dpi sets the resolution of the saved PNGs.
     """
     try:
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        _makedirs_once(output_dir)
 
         # Find all CSV files in the input directory
         csv_files = glob.glob(os.path.join(input_dir, "*.csv"))
@@ -148,101 +638,38 @@ def plot_consolidated_fairness(                               input_dir='output/
         # print(f"Found {len(filtered_files)} CSV files to process for consolidated fairness plots")
 
         # Setup figures for consolidated plots
-        fig_jfi = plt.figure(figsize=(10, 6))
-        ax_jfi = fig_jfi.add_subplot(111)
-        # ax_jfi.set_title("Jain's Fairness Index Comparison", fontsize=20)
-        ax_jfi.set_xlabel('Number of WiFi/NRU Nodes', fontsize=20)
-        ax_jfi.set_ylabel("Jain's Fairness Index", fontsize=20)
-        ax_jfi.grid(True, linestyle='--', alpha=0.7)  # Added grid with dashed lines
-        ax_jfi.set_ylim(0.4, 1.05)
-        ax_jfi.tick_params(axis='both', which='major', labelsize=16)
-
-        fig_jaf = plt.figure(figsize=(10, 6))
-        ax_jaf = fig_jaf.add_subplot(111)
-       # ax_jaf.set_title("Joint Airtime Fairness Comparison", fontsize=20)
-        ax_jaf.set_xlabel('Number of WiFi/NRU Nodes', fontsize=20)
-        ax_jaf.set_ylabel("Joint Airtime Fairness", fontsize=20)
-        ax_jaf.grid(True, linestyle='--', alpha=0.7)  # Added grid with dashed lines
-        ax_jaf.set_ylim(0, 1.05)
-        ax_jaf.tick_params(axis='both', which='major', labelsize=16)
-
-        # Define line styles, markers, and colors
-        line_styles = ['-', '--', '-.', ':']
-        markers = ['o', 's', '^', 'D', 'v', '*', 'x', '+']
-        colors = set_plot_style()  # Use the same colors as in visualize_network_metrics.py
-
-        # Create cyclers for styles, markers and colors
-        style_cycler = itertools.cycle(line_styles)
-        marker_cycler = itertools.cycle(markers)
-        color_cycler = itertools.cycle(colors)
-
-        # Process each file and add to consolidated plots
-        for csv_file in filtered_files:
-            try:
-                # Get a short name for the legend
-                file_basename = os.path.basename(csv_file).replace('.csv', '')
-
-                # Get custom legend name
-                custom_legend = get_custom_legend(file_basename)
-
-                # Get next style, marker and color
-                line_style = next(style_cycler)
-                marker = next(marker_cycler)
-                color = next(color_cycler)
-
-                # Load the data
-                print(f"  Processing {os.path.basename(csv_file)}")
-                df = pd.read_csv(csv_file)
-
-                # Check if required columns exist
-                required_columns = ["wifi_node_count", "jain's_fairness_index", "joint_airtime_fairness"]
-                if not all(col in df.columns for col in required_columns):
-                    # print(f"  Warning: Required columns not found in {csv_file}. Skipping.")
-                    continue
-
-                # Group by node count and calculate averages
-                df_avg = df.groupby('wifi_node_count').agg({
-                    "jain's_fairness_index": 'mean',
-                    "joint_airtime_fairness": 'mean'
-                }).reset_index()
-
-                # Add to consolidated plots with custom style
-                ax_jfi.plot(df_avg['wifi_node_count'], df_avg["jain's_fairness_index"],
-                            marker=marker, linestyle=line_style, color=color, linewidth=2, label=custom_legend)
-                ax_jaf.plot(df_avg['wifi_node_count'], df_avg["joint_airtime_fairness"],
-                            marker=marker, linestyle=line_style, color=color, linewidth=2, label=custom_legend)
+        figures = (plt.subplots(figsize=(10, 6)), plt.subplots(figsize=(10, 6)))
 
-            except Exception as e:
-                print(f"  Error processing {csv_file}: {e}")
-
-        # Finalize and save the plots
-        ax_jfi.legend(loc='best', frameon=True, shadow=True, fontsize=15)
-        plt.figure(fig_jfi.number)
-        plt.tight_layout()
+        # Process each file and add to consolidated plots with custom style
         output_file_jfi = os.path.join(output_dir, "consolidated_jains_fairness_index.png")
-        plt.savefig(output_file_jfi, dpi=300)
-        print(f"  Saved consolidated JFI plot to {output_file_jfi}")
-
-        ax_jaf.legend(loc='best', frameon=True, shadow=True, fontsize=15)
-        plt.figure(fig_jaf.number)
-        plt.tight_layout()
         output_file_jaf = os.path.join(output_dir, "consolidated_joint_airtime_fairness.png")
-        plt.savefig(output_file_jaf, dpi=300)
+        _render_series_group(
+            figures,
+            _fairness_series(filtered_files, precomputed, report_skipped=False),
+            titles=(None, None),
+            ylims=((0.4, 1.05), (0, 1.05)),
+            output_paths=(output_file_jfi, output_file_jaf),
+            dpi=dpi,
+        )
+        print(f"  Saved consolidated JFI plot to {output_file_jfi}")
         print(f"  Saved consolidated JAF plot to {output_file_jaf}")
 
-        plt.close('all')
+        for fig, _ in figures:
+            plt.close(fig)
 
     except Exception as e:
         warnings.warn(f"Error in plot_consolidated_fairness: {str(e)}")
 
 
-def plot_individual_fairness(input_dir='output/simulation_results', output_dir='output/metrics_visualizations/fairness_plots/individual'):
+def plot_individual_fairness(input_dir='output/simulation_results', output_dir='output/metrics_visualizations/fairness_plots/individual',
+                             precomputed=None):
     """
     Generate individual plots for each CSV file showing fairness metrics
+    precomputed optionally maps CSV paths to their averaged arrays (see _load_and_reduce).
     """
     try:
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        _makedirs_once(output_dir)
 
         # Find all CSV files in the input directory
         csv_files = glob.glob(os.path.join(input_dir, "*.csv"))
@@ -256,6 +683,9 @@ def plot_individual_fairness(input_dir='output/simulation_results', output_dir='
 
         print(f"\nGenerating individual fairness plots for {len(filtered_files)} CSV files")
 
+        # One figure is reused (and cleared) for every individual plot
+        fig, ax = plt.subplots(figsize=(10, 6))
+
         for csv_file in filtered_files:
             try:
                 # Get filename for plot title
@@ -264,43 +694,36 @@ def plot_individual_fairness(input_dir='output/simulation_results', output_dir='
 
                 print(f"  Processing {file_basename}")
 
-                # Load the data
-                df = pd.read_csv(csv_file)
-
-                # Check if required columns exist
-                required_columns = ["wifi_node_count", "jain's_fairness_index", "joint_airtime_fairness"]
-                if not all(col in df.columns for col in required_columns):
+                # Load the averaged data
+                averages = _get_fairness_averages(csv_file, precomputed)
+                if averages is None:
                     print(f"  Warning: Required columns not found in {csv_file}. Skipping.")
                     continue
-
-                # Group by node count and calculate averages
-                df_avg = df.groupby('wifi_node_count').agg({
-                    "jain's_fairness_index": 'mean',
-                    "joint_airtime_fairness": 'mean'
-                }).reset_index()
+                node_counts, jfi_avg, jaf_avg = averages
 
                 # Create subfolder for this file
                 file_output_dir = os.path.join(output_dir, file_basename)
-                os.makedirs(file_output_dir, exist_ok=True)
+                _makedirs_once(file_output_dir)
 
                 # Plot Jain's Fairness Index
                 jfi_output_path = os.path.join(file_output_dir, f"{file_basename}_jains_fairness_index.png")
                 create_fairness_plot(
-                    df_avg['wifi_node_count'],
-                    df_avg["jain's_fairness_index"],
+                    node_counts,
+                    jfi_avg,
                     f"Jain's Fairness Index\n({custom_title})",
                     'Number of WiFi/NRU Nodes',
                     "Jain's Fairness Index",
                     jfi_output_path,
                     ylim=(0.4, 1.05),
-                    color='blue'
+                    color='blue',
+                    ax=ax
                 )
 
                 # Plot Joint Airtime Fairness
                 jaf_output_path = os.path.join(file_output_dir, f"{file_basename}_joint_airtime_fairness.png")
                 create_fairness_plot(
-                    df_avg['wifi_node_count'],
-                    df_avg["joint_airtime_fairness"],
+                    node_counts,
+                    jaf_avg,
                     f"Joint Airtime Fairness\n({custom_title})",
                     'Number of WiFi/NRU Nodes',
                     "Joint Airtime Fairness",
@@ -308,23 +731,29 @@ def plot_individual_fairness(input_dir='output/simulation_results', output_dir='
                     ylim=(0, 1.05),
                     color='green',
                     marker='s',
-                    linestyle='--'
+                    linestyle='--',
+                    ax=ax
                 )
 
             except Exception as e:
                 print(f"  Error processing individual plot for {csv_file}: {e}")
 
+        plt.close(fig)
+
     except Exception as e:
         warnings.warn(f"Error in plot_individual_fairness: {str(e)}")
 
 
-def plot_fairness_by_categories(input_dir='output/simulation_results', output_dir='output/metrics_visualizations/fairness_plots/categories'):
+def plot_fairness_by_categories(input_dir='output/simulation_results', output_dir='output/metrics_visualizations/fairness_plots/categories',
+                                precomputed=None, dpi=150):
     """
     Group files by categories and plot fairness metrics for each category
+    precomputed optionally maps CSV paths to their averaged arrays (see _load_and_reduce).
+    dpi sets the resolution of the saved PNGs.
     """
     try:
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        _makedirs_once(output_dir)
 
         # Define categories and their patterns
         categories = {
@@ -358,6 +787,9 @@ def plot_fairness_by_categories(input_dir='output/simulation_results', output_di
 
         print(f"\nProcessing files by categories from {len(filtered_files)} filtered files")
 
+        # Setup figures once; their axes are cleared and restyled per category
+        figures = (plt.subplots(figsize=(10, 6)), plt.subplots(figsize=(10, 6)))
+
         # Process each category
         for category, config in categories.items():
             category_files = []
@@ -385,105 +817,53 @@ def plot_fairness_by_categories(input_dir='output/simulation_results', output_di
 
             # Create category output directory
             category_output_dir = os.path.join(output_dir, category)
-            os.makedirs(category_output_dir, exist_ok=True)
-
-            # Setup figures for consolidated plots
-            fig_jfi = plt.figure(figsize=(10, 6))
-            ax_jfi = fig_jfi.add_subplot(111)
-            ax_jfi.set_title(f"Jain's Fairness Index - {config['title']}", fontsize=20)
-            ax_jfi.set_xlabel('Number of WiFi/NRU Nodes', fontsize=20)
-            ax_jfi.set_ylabel("Jain's Fairness Index", fontsize=20)
-            ax_jfi.grid(True, linestyle='--', alpha=0.7)  # Added grid with dashed lines
-            ax_jfi.set_ylim(0.4, 1.05)
-            ax_jfi.tick_params(axis='both', which='major', labelsize=16)
-
-            fig_jaf = plt.figure(figsize=(10, 6))
-            ax_jaf = fig_jaf.add_subplot(111)
-            ax_jaf.set_title(f"Joint Airtime Fairness - {config['title']}", fontsize=20)
-            ax_jaf.set_xlabel('Number of WiFi/NRU Nodes', fontsize=20)
-            ax_jaf.set_ylabel("Joint Airtime Fairness", fontsize=20)
-            ax_jaf.grid(True, linestyle='--', alpha=0.7)  # Added grid with dashed lines
-            ax_jfi.set_ylim(0, 1.05)
-            ax_jaf.tick_params(axis='both', which='major', labelsize=16)
-
-            # Define line styles, markers, and colors
-            line_styles = ['-', '--', '-.', ':']
-            markers = ['o', 's', '^', 'D', 'v', '*', 'x', '+']
-            colors = set_plot_style()
-
-            # Create cyclers for styles, markers and colors
-            style_cycler = itertools.cycle(line_styles)
-            marker_cycler = itertools.cycle(markers)
-            color_cycler = itertools.cycle(colors)
-
-            # Process each file in this category
-            for csv_file in category_files:
-                try:
-                    # Get a short name for the legend
-                    file_basename = os.path.basename(csv_file).replace('.csv', '')
-                    custom_legend = get_custom_legend(file_basename)
-
-                    # Get next style, marker and color
-                    line_style = next(style_cycler)
-                    marker = next(marker_cycler)
-                    color = next(color_cycler)
-
-                    # Load the data
-                    print(f"    Processing {os.path.basename(csv_file)}")
-                    df = pd.read_csv(csv_file)
-
-                    # Check if required columns exist
-                    required_columns = ["wifi_node_count", "jain's_fairness_index", "joint_airtime_fairness"]
-                    if not all(col in df.columns for col in required_columns):
-                        print(f"    Warning: Required columns not found in {csv_file}. Skipping.")
-                        continue
-
-                    # Group by node count and calculate averages
-                    df_avg = df.groupby('wifi_node_count').agg({
-                        "jain's_fairness_index": 'mean',
-                        "joint_airtime_fairness": 'mean'
-                    }).reset_index()
-
-                    # Add to plots with custom style
-                    ax_jfi.plot(df_avg['wifi_node_count'], df_avg["jain's_fairness_index"],
-                                marker=marker, linestyle=line_style, color=color, linewidth=2, label=custom_legend)
-                    ax_jaf.plot(df_avg['wifi_node_count'], df_avg["joint_airtime_fairness"],
-                                marker=marker, linestyle=line_style, color=color, linewidth=2, label=custom_legend)
-
-                except Exception as e:
-                    print(f"    Error processing {csv_file} for category {category}: {e}")
-
-            # Finalize and save the plots
-            ax_jfi.legend(loc='best', frameon=True, shadow=True, fontsize=15)
-            plt.figure(fig_jfi.number)
-            plt.tight_layout()
-            output_file_jfi = os.path.join(category_output_dir, f"{category}_jains_fairness_index.png")
-            plt.savefig(output_file_jfi, dpi=300)
-            print(f"    Saved {category} JFI plot to {output_file_jfi}")
+            _makedirs_once(category_output_dir)
 
-            ax_jaf.legend(loc='best', frameon=True, shadow=True, fontsize=15)
-            plt.figure(fig_jaf.number)
-            plt.tight_layout()
+            # Render this category on the shared figures
+            output_file_jfi = os.path.join(category_output_dir, f"{category}_jains_fairness_index.png")
             output_file_jaf = os.path.join(category_output_dir, f"{category}_joint_airtime_fairness.png")
-            plt.savefig(output_file_jaf, dpi=300)
+            _render_series_group(
+                figures,
+                _fairness_series(category_files, precomputed, indent='    ',
+                                 context=f" for category {category}"),
+                titles=(f"Jain's Fairness Index - {config['title']}",
+                        f"Joint Airtime Fairness - {config['title']}"),
+                # The JFI axis keeps the 0-1.05 range the category plots have always used
+                ylims=((0, 1.05), None),
+                output_paths=(output_file_jfi, output_file_jaf),
+                dpi=dpi,
+            )
+            print(f"    Saved {category} JFI plot to {output_file_jfi}")
             print(f"    Saved {category} JAF plot to {output_file_jaf}")
 
-            plt.close('all')
+        for fig, _ in figures:
+            plt.close(fig)
 
     except Exception as e:
         warnings.warn(f"Error in plot_fairness_by_categories: {str(e)}")
 
 
+def _count_pngs(path):
+    """Recursively count .png files under path using os.scandir"""
+    count = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    count += _count_pngs(entry.path)
+                elif entry.name.endswith('.png'):
+                    count += 1
+    except FileNotFoundError:
+        pass
+    return count
+
+
 def generate_summary():
     """Generate a summary of all fairness plots created"""
     try:
         print("\n=== Summary of Generated Fairness Plots ===")
 
-        count = 0
-        for root, dirs, files in os.walk('output/metrics_visualizations/fairness_plots'):
-            for file in files:
-                if file.endswith('.png'):
-                    count += 1
+        count = _count_pngs('output/metrics_visualizations/fairness_plots')
 
         print(f"\nTotal number of generated fairness plots: {count}")
     except Exception as e:
@@ -503,31 +883,51 @@ def main():
                         help='Generate plots by categories')
     parser.add_argument('--consolidated', action='store_true', default=True,
                         help='Generate consolidated plots')
+    parser.add_argument('--cache-parquet', action='store_true',
+                        help='Convert the CSV files to Parquet caches that later runs read instead')
+    parser.add_argument('--fast-parse', action='store_true',
+                        help='Parse the CSV files with the numba-compiled reader (falls back to pandas per file)')
+    parser.add_argument('--dpi', type=int, default=150,
+                        help='Resolution of the consolidated and category plots (default: 150, use 300 for print quality)')
 
     args = parser.parse_args()
 
     # print("\n=== Starting Fairness Visualization Process ===\n")
 
     # Set plot style
-    set_plot_style()
+    _apply_rc_once()
+
+    # Parse and average every included CSV once, shared by all plot types
+    csv_files = glob.glob(os.path.join(args.dir, "*.csv"))
+    filtered_files = [f for f in csv_files if should_include_file(f)]
+
+    if args.cache_parquet:
+        for csv_file in filtered_files:
+            try:
+                _ensure_parquet(csv_file)
+            except Exception as e:
+                warnings.warn(f"Could not cache {csv_file} as Parquet: {str(e)}")
+    if args.fast_parse and njit is None:
+        warnings.warn("--fast-parse requires numba; using the regular CSV readers")
+    precomputed = _load_and_reduce(filtered_files, args.fast_parse)
 
     # Generate consolidated plots
     if args.consolidated:
         # print("\n--- Generating Consolidated Fairness Plots ---")
         consolidated_output_dir = os.path.join(args.output, 'consolidated')
-        plot_consolidated_fairness(args.dir, consolidated_output_dir)
+        plot_consolidated_fairness(args.dir, consolidated_output_dir, precomputed, args.dpi)
 
     # Generate individual plots if requested
     if args.individual:
         print("\n--- Generating Individual Fairness Plots ---")
         individual_output_dir = os.path.join(args.output, 'individual')
-        plot_individual_fairness(args.dir, individual_output_dir)
+        plot_individual_fairness(args.dir, individual_output_dir, precomputed)
 
     # Generate category plots if requested
     if args.categories:
         print("\n--- Generating Category-based Fairness Plots ---")
         categories_output_dir = os.path.join(args.output, 'categories')
-        plot_fairness_by_categories(args.dir, categories_output_dir)
+        plot_fairness_by_categories(args.dir, categories_output_dir, precomputed, args.dpi)
 
     # Generate summary
     generate_summary()
@@ -1,22 +1,49 @@
+import argparse
+import contextlib
+import fnmatch
+import functools
 import glob
+import io
 import os
+import matplotlib as mpl
+
+# Only PNGs are written, so default to the non-interactive backend and skip
+# GUI toolkit start-up. An explicit MPLBACKEND wins.
+if not os.environ.get('MPLBACKEND'):
+    mpl.use('Agg', force=True)
+
+# Cheaper rasterization of line paths for batch plotting
+mpl.rcParams['path.simplify'] = True
+mpl.rcParams['path.simplify_threshold'] = 1.0
+mpl.rcParams['agg.path.chunksize'] = 10000
+
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
-import matplotlib as mpl
 import re
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from cycler import cycler
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    # pyarrow is optional; pandas' C parser is used without it
+    pa = pacsv = None
+
 def extract_parameters(filename):
     """Extract parameters from filename like wifi-only_nodes-1-10_raw-data.csv"""
     match = re.search(r"wifi-only_nodes-(\d+-\d+)", filename)
     return match.group(1) if match else "unknown"
 
+@functools.lru_cache(maxsize=1)
 def set_distinct_color_palette():
     """
     Sets a color palette with visually distinct colors suitable for visualization
     Uses a colorblind-friendly palette based on Color Brewer and ColorSafe recommendations
+
+    Cached, so repeated calls in a process (or a forked worker) are no-ops.
     """
     # High-contrast and colorblind-friendly palette
     distinct_colors = [
@@ -33,105 +60,238 @@ def set_distinct_color_palette():
     # Return the colors in case needed elsewhere
     return distinct_colors
 
-def create_plot(x_data, y_data, title, xlabel, ylabel, output_path, ylim=(0, 1), linestyle="-"):
-    """Create and save a plot with given data and parameters"""
-    fig, ax = plt.subplots()
-    y_data.plot(marker="o", legend=True, ylim=ylim, linestyle='-')
+# Number of plots saved by this process
+_PLOT_COUNT = 0
+
+
+def _count_saved_plot(output_path):
+    """Record and report a saved plot"""
+    global _PLOT_COUNT
+    _PLOT_COUNT += 1
+    print(f"  Saved plot: {output_path}")
+
+
+# Figure and axes shared by every plot in this process, cleared between plots
+_FIG, _AX = None, None
+
+
+def _get_plot_axes():
+    """Return the shared figure and axes, creating them on first use and clearing them after"""
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG, _AX = plt.subplots()
+    else:
+        _AX.clear()
+    return _FIG, _AX
+
+
+# Three-row figure shared by every dual metric plot in this process; each row
+# holds a pair of line artists whose data is replaced for every plot
+_DUAL_FIG, _DUAL_AXES, _DUAL_LINES = None, None, None
+
+
+def _get_dual_plot_figure():
+    """Return the shared dual metric figure, its axes and line artists (two per axes)"""
+    global _DUAL_FIG, _DUAL_AXES, _DUAL_LINES
+    if _DUAL_FIG is None:
+        _DUAL_FIG, _DUAL_AXES = plt.subplots(3, 1, sharex=True, figsize=(6.4, 12))
+        _DUAL_LINES = []
+        for ax in _DUAL_AXES:
+            _DUAL_LINES.append(ax.plot([], [], marker="o", linestyle='-')[0])
+            _DUAL_LINES.append(ax.plot([], [], marker="D", linestyle='-.')[0])
+    return _DUAL_FIG, _DUAL_AXES, _DUAL_LINES
+
+
+# Columns (and their dtypes) each plot type reads from the simulation CSVs
+_WIFI_DTYPES = {
+    'wifi_node_count': 'int16',
+    'wifi_channel_occupancy': 'float32', 'wifi_channel_efficiency': 'float32',
+    'wifi_collision_probability': 'float32',
+}
+_NRU_DTYPES = {
+    'nru_node_count': 'int16',
+    'nru_channel_occupancy': 'float32', 'nru_channel_efficiency': 'float32',
+    'nru_collision_probability': 'float32',
+}
+_COEX_DTYPES = {**_NRU_DTYPES, **_WIFI_DTYPES}
+
+
+def read_columns(csv_path, dtypes):
+    """Read only the columns named in dtypes from a CSV, with those dtypes"""
+    return pd.read_csv(csv_path, usecols=list(dtypes), dtype=dtypes, engine='c')
+
+
+def _maybe_downsample(x, y, target_width=800):
+    """
+    Reduce a long series to a min/max envelope with one pair of points per output
+    column, keeping its visual extent. Series of up to 2 * target_width points
+    (every sweep so far) are returned unchanged.
+
+    The bucket midpoints are computed in float64, so int16 node counts past
+    16383 do not wrap:
+
+    >>> x, _ = _maybe_downsample(np.arange(1, 20001, dtype=np.int16), np.zeros(20000))
+    >>> bool(x.min() > 0 and np.all(np.diff(x) >= 0))
+    True
+    """
+    if len(x) <= 2 * target_width:
+        return x, y
+    edges = np.linspace(0, len(x), target_width + 1, dtype=int)
+    starts = edges[:-1]
+    y_min = np.minimum.reduceat(y, starts)
+    y_max = np.maximum.reduceat(y, starts)
+    x_mid = (x[starts].astype(np.float64) + x[edges[1:] - 1]) / 2
+    return np.repeat(x_mid, 2), np.column_stack([y_min, y_max]).ravel()
+
+
+def _series_xy(series):
+    """x (index) and y arrays of a Series, downsampled for plotting if very long"""
+    return _maybe_downsample(series.index.to_numpy(), series.to_numpy())
+
+
+def create_plot(y_data, title, xlabel, ylabel, output_path, ylim=(0, 1), linestyle="-"):
+    """Create and save a plot of a Series (index on the x axis) with given parameters"""
+    fig, ax = _get_plot_axes()
+    ax.plot(*_series_xy(y_data), marker="o", linestyle='-')
+    ax.set_ylim(ylim)
     ax.legend([title])
     ax.set_xlabel(xlabel, fontsize=14)
     ax.set_ylabel(ylabel, fontsize=14)
     # ax.legend(loc = 'best')
-    plt.tight_layout()
-    plt.savefig(output_path)
-    print(f"  Saved plot: {output_path}")
+    fig.tight_layout()
+    fig.savefig(output_path)
+    _count_saved_plot(output_path)
     # plt.show()
-    plt.close(fig)
 
-def create_dual_plot(x_data1, y_data1, x_data2, y_data2, titles, xlabel, ylabel, output_path, ylim=(0, 1)):
+def create_dual_plot(y_data1, y_data2, titles, xlabel, ylabel, output_path, ylim=(0, 1)):
     """Create and save a plot with two data series"""
-
-    # Create directory if it doesn't exist
-    output_dir = os.path.dirname(output_path)
-    os.makedirs(output_dir, exist_ok=True)  # <-- Add this line
-
-    fig, ax = plt.subplots()
-    y_data1.plot(marker="o", legend=True, ylim=ylim, linestyle='-')
-    y_data2.plot(marker="D", legend=True, ylim=ylim, linestyle='-.')
+    fig, ax = _get_plot_axes()
+    ax.plot(*_series_xy(y_data1), marker="o", linestyle='-')
+    ax.plot(*_series_xy(y_data2), marker="D", linestyle='-.')
+    ax.set_ylim(ylim)
     ax.legend(titles)
     ax.set_xlabel(xlabel, fontsize=14)
     ax.set_ylabel(ylabel, fontsize=14)
-    plt.tight_layout()
-    plt.savefig(output_path)
-    print(f"  Saved plot: {output_path}")
+    fig.tight_layout()
+    fig.savefig(output_path)
+    _count_saved_plot(output_path)
     # plt.show() # disp
-    plt.close(fig)
 
-def plot_metrics(data, node_count_col, metric_cols, titles, output_dir, filename_prefix, ylims=None,
-                 technology_type=None):
-    """Generic function to plot metrics data"""
+
+# One-row, three-column figure shared by every combined metrics plot in this process
+_COMBINED_FIG, _COMBINED_AXES = None, None
+
+
+def plot_metrics_combined(data, node_col, metric_cols, titles, output_dir, filename_prefix, ylims=None,
+                          node_label="Number of nodes"):
+    """Plot occupancy, efficiency and collision probability side by side in a single PNG"""
+    global _COMBINED_FIG, _COMBINED_AXES
     if ylims is None:
         ylims = [(0, 1), (0, 1), (0, 1)]
 
-    # Group data by node count and calculate mean for each metric
-    grouped_data = []
-    for col in metric_cols:
-        grouped_data.append(data.groupby([node_count_col])[col].mean())
+    # Group data by node count once and calculate the mean of every metric
+    means = data.groupby(node_col, observed=True)[metric_cols].mean()
 
-    # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
+    if _COMBINED_FIG is None:
+        _COMBINED_FIG, _COMBINED_AXES = plt.subplots(1, 3, figsize=(15, 4))
+    fig = _COMBINED_FIG
+
     print(f"\nGenerating plots for {filename_prefix}:")
-    # Plot metrics
-    metrics = ['cot', 'eff', 'pcol']
-
-    # Set y-axis labels based on technology type
-    if technology_type == "wifi":
-        node_label = "Number of Wi-Fi Nodes"
-    elif technology_type == "nru":
-        node_label = "Number of NR-U Nodes"
-    else:
-        node_label = "Number of nodes"
-
-    for i, (metric_data, title, ylim) in enumerate(zip(grouped_data, titles, ylims)):
-        output_path = os.path.join(output_dir, f"{filename_prefix}_{metrics[i]}.png")
-        create_plot(
-            None, metric_data, title, node_label,
-            ['Channel Occupancy', 'Channel Efficiency', 'Collision Probability'][i],
-            output_path, ylim=ylim
-        )
-
-def plot_dual_metrics(data, node_count_cols, metric_cols, titles, output_dir, filename_prefix, ylims=None):
-    """Generic function to plot dual metrics data"""
-    if ylims is None:
-        ylims = [(0, 1), (0, 1), (0, 1)]
+    labels = ['Channel Occupancy', 'Channel Efficiency', 'Collision Probability']
+    for ax, metric_col, title, ylim, label in zip(_COMBINED_AXES, metric_cols, titles, ylims, labels):
+        ax.clear()
+        ax.plot(*_series_xy(means[metric_col]), marker="o", linestyle='-')
+        ax.set_ylim(ylim)
+        ax.legend([title])
+        ax.set_xlabel(node_label, fontsize=14)
+        ax.set_ylabel(label, fontsize=14)
+
+    output_path = os.path.join(output_dir, f"{filename_prefix}_combined.png")
+    fig.tight_layout()
+    fig.savefig(output_path)
+    _count_saved_plot(output_path)
+
+
+def _plot_metrics_3(data, node_col, m0, m1, m2, t0, t1, t2, ylims, output_dir, prefix, node_label):
+    """
+    Plot the occupancy, efficiency and collision probability metrics (m0, m1, m2)
+    of an individual system as one _cot/_eff/_pcol PNG each
+    """
+    means = data.groupby(node_col, observed=True)[[m0, m1, m2]].mean()
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"\nGenerating plots for {prefix}:")
+    create_plot(means[m0], t0, node_label, 'Channel Occupancy',
+                os.path.join(output_dir, f"{prefix}_cot.png"), ylim=ylims[0])
+    create_plot(means[m1], t1, node_label, 'Channel Efficiency',
+                os.path.join(output_dir, f"{prefix}_eff.png"), ylim=ylims[1])
+    create_plot(means[m2], t2, node_label, 'Collision Probability',
+                os.path.join(output_dir, f"{prefix}_pcol.png"), ylim=ylims[2])
+
+
+def _metrics_by_node_col(node_count_cols, metric_cols):
+    """Map each node count column to the metric columns averaged over it"""
+    metrics_by_node_col = {}
+    for node_col, metric_col in zip(node_count_cols, metric_cols):
+        metrics_by_node_col.setdefault(node_col, []).append(metric_col)
+    return metrics_by_node_col
+
+
+def _set_dual_row(ax, nru_line, wifi_line, nru_y, wifi_y, ylim, ylabel):
+    """Put one NR-U/Wi-Fi metric pair into a row of the shared dual metric figure"""
+    nru_line.set_data(*_series_xy(nru_y))
+    wifi_line.set_data(*_series_xy(wifi_y))
+    ax.relim()
+    ax.autoscale_view(scaley=False)
+    ax.set_ylim(ylim)
+    ax.legend((nru_line, wifi_line), (' NR-U', ' Wi-Fi'))
+    ax.set_ylabel(ylabel, fontsize=14)
 
-    # Group data by node count and calculate mean for each metric
-    grouped_data = []
-    for col_pair in zip(node_count_cols, metric_cols):
-        node_col, metric_col = col_pair
-        grouped_data.append(data.groupby([node_col])[metric_col].mean())
 
-    # Create output directory if it doesn't exist
+def _plot_dual_metrics_3pairs(nru_means, wifi_means, ylims, output_dir, filename_prefix, per_metric=False):
+    """
+    Plot NR-U vs Wi-Fi occupancy, efficiency and collision probability as three
+    stacked rows of the shared dual metric figure. nru_means and wifi_means
+    hold the metric means indexed by nru_node_count and wifi_node_count.
+    With per_metric, each pair is saved as its own _cot/_eff/_pcol PNG instead
+    of one stacked figure.
+    """
     os.makedirs(output_dir, exist_ok=True)
 
     print(f"\nGenerating plots for {filename_prefix}:")
-    # Plot metrics in pairs
-    metrics = ['cot', 'eff', 'pcol']
-    labels = ['Channel Occupancy', 'Channel Efficiency', 'Collision Probability']
+    if per_metric:
+        node_label = "Number of WiFi/NR-U Nodes"
+        create_dual_plot(nru_means['nru_channel_occupancy'], wifi_means['wifi_channel_occupancy'],
+                         [' NR-U', ' Wi-Fi'], node_label, 'Channel Occupancy',
+                         os.path.join(output_dir, f"{filename_prefix}_cot.png"), ylim=ylims[0])
+        create_dual_plot(nru_means['nru_channel_efficiency'], wifi_means['wifi_channel_efficiency'],
+                         [' NR-U', ' Wi-Fi'], node_label, 'Channel Efficiency',
+                         os.path.join(output_dir, f"{filename_prefix}_eff.png"), ylim=ylims[1])
+        create_dual_plot(nru_means['nru_collision_probability'], wifi_means['wifi_collision_probability'],
+                         [' NR-U', ' Wi-Fi'], node_label, 'Collision Probability',
+                         os.path.join(output_dir, f"{filename_prefix}_pcol.png"), ylim=ylims[2])
+        return
 
-    # For coexisting technologies, use combined label
-    node_label = "Number of WiFi/NR-U Nodes"
+    fig, (ax0, ax1, ax2), lines = _get_dual_plot_figure()
+    _set_dual_row(ax0, lines[0], lines[1], nru_means['nru_channel_occupancy'],
+                  wifi_means['wifi_channel_occupancy'], ylims[0], 'Channel Occupancy')
+    _set_dual_row(ax1, lines[2], lines[3], nru_means['nru_channel_efficiency'],
+                  wifi_means['wifi_channel_efficiency'], ylims[1], 'Channel Efficiency')
+    _set_dual_row(ax2, lines[4], lines[5], nru_means['nru_collision_probability'],
+                  wifi_means['wifi_collision_probability'], ylims[2], 'Collision Probability')
+    ax2.set_xlabel("Number of WiFi/NR-U Nodes", fontsize=14)
 
-    for i in range(0, len(grouped_data), 2):
-        if i + 1 < len(grouped_data):  # Ensure we have pairs
-            output_path = os.path.join(output_dir, f"{filename_prefix}_{metrics[i // 2]}.png")
-            create_dual_plot(
-                None, grouped_data[i], None, grouped_data[i + 1],
-                [titles[i], titles[i + 1]], node_label,
-                labels[i // 2], output_path, ylim=ylims[i // 2]
-            )
+    output_path = os.path.join(output_dir, f"{filename_prefix}.png")
+    fig.tight_layout()
+    fig.savefig(output_path)
+    _count_saved_plot(output_path)
 
-def plot_wifi_metrics():
+
+def plot_wifi_metrics(per_metric=False):
+    """Plot the Wi-Fi only metrics: one combined PNG, or one PNG per metric if per_metric"""
     # Find WiFi CSV file
     try:
         csv_files = glob.glob('output/simulation_results/wifi-only_nodes-*_raw-data.csv')
@@ -141,9 +301,12 @@ def plot_wifi_metrics():
         csv_path = csv_files[0]
         params = extract_parameters(os.path.basename(csv_path))
         # Load data
-        wifi_metrics = pd.read_csv(csv_path)
+        wifi_metrics = read_columns(csv_path, _WIFI_DTYPES)
+
+        output_dir = 'output/metrics_visualizations/individual_systems/wifi'
+        output_prefix = f"wifi_nodes-{params}"
+        ylims = [(0.6, 1), (0, 1), (0, 0.5)]
 
-        # Define metrics to plot
         metric_cols = ['wifi_channel_occupancy', 'wifi_channel_efficiency', 'wifi_collision_probability']
         titles = [
             f'Wi-Fi Channel Occupancy ({params})',
@@ -151,19 +314,22 @@ def plot_wifi_metrics():
             f'Wi-Fi Collision Probability ({params})'
         ]
 
-        output_dir = 'output/metrics_visualizations/individual_systems/wifi'
-        output_prefix = f"wifi_nodes-{params}"
-        ylims = [(0.6, 1), (0, 1), (0, 0.5)]
-
-        plot_metrics(
-            wifi_metrics, 'wifi_node_count', metric_cols, titles,
-            output_dir, output_prefix, ylims, technology_type="wifi"
-        )
+        if per_metric:
+            _plot_metrics_3(
+                wifi_metrics, 'wifi_node_count', *metric_cols, *titles,
+                ylims, output_dir, output_prefix, "Number of Wi-Fi Nodes"
+            )
+        else:
+            plot_metrics_combined(
+                wifi_metrics, 'wifi_node_count', metric_cols, titles,
+                output_dir, output_prefix, ylims, "Number of Wi-Fi Nodes"
+            )
     except Exception as e:
         warnings.warn(f"Skipping WiFi metrics: {str(e)}")
 
 
-def plot_nru_metrics(mode):
+def plot_nru_metrics(mode, per_metric=False):
+    """Plot the NR-U only metrics: one combined PNG, or one PNG per metric if per_metric"""
     # Load data
     csv_path = f'output/simulation_results/nru-only_{mode}-mode_raw-data.csv'
     if not os.path.exists(csv_path):
@@ -171,25 +337,30 @@ def plot_nru_metrics(mode):
         return
 
     try:
-        nru_metrics = pd.read_csv(csv_path)
-
-        # Define metrics to plot
-        metric_cols = ['nru_channel_occupancy', 'nru_channel_efficiency', 'nru_collision_probability']
-        titles = [f'NR-U ', f'NR-U ', f'NR-U ']
+        nru_metrics = read_columns(csv_path, _NRU_DTYPES)
 
         output_dir = f'output/metrics_visualizations/individual_systems/nru'
         output_prefix = f"nru_{mode}"
         ylims = [(0.6, 1), (0.6, 1), (0, 0.6)]
 
-        plot_metrics(
-            nru_metrics, 'nru_node_count', metric_cols, titles,
-            output_dir, output_prefix, ylims, technology_type="nru"
-        )
+        metric_cols = ['nru_channel_occupancy', 'nru_channel_efficiency', 'nru_collision_probability']
+        titles = ['NR-U ', 'NR-U ', 'NR-U ']
+
+        if per_metric:
+            _plot_metrics_3(
+                nru_metrics, 'nru_node_count', *metric_cols, *titles,
+                ylims, output_dir, output_prefix, "Number of NR-U Nodes"
+            )
+        else:
+            plot_metrics_combined(
+                nru_metrics, 'nru_node_count', metric_cols, titles,
+                output_dir, output_prefix, ylims, "Number of NR-U Nodes"
+            )
     except Exception as e:
         warnings.warn(f"Error processing NRU {mode} metrics: {str(e)}")
 
 
-def plot_coexistence_metrics(mode):
+def plot_coexistence_metrics(mode, per_metric=False):
     # Load data
     csv_path = f'output/simulation_results/coex_{mode}-mode_raw-data.csv'
     if not os.path.exists(csv_path):
@@ -197,85 +368,123 @@ def plot_coexistence_metrics(mode):
         return
 
     try:
-        coex_metrics = pd.read_csv(csv_path)
-
-        # Define metrics to plot
-        node_count_cols = ['nru_node_count', 'wifi_node_count'] * 3
-        metric_cols = [
-            'nru_channel_occupancy', 'wifi_channel_occupancy',
-            'nru_channel_efficiency', 'wifi_channel_efficiency',
-            'nru_collision_probability', 'wifi_collision_probability'
-        ]
-        titles = [
-            ' NR-U', ' Wi-Fi',
-            ' NR-U', ' Wi-Fi',
-            ' NR-U', ' Wi-Fi'
-        ]
+        coex_metrics = read_columns(csv_path, _COEX_DTYPES)
 
         output_dir = f'output/metrics_visualizations/coexistence_strategies/coex_{mode}'
         output_prefix = f"coexistence_{mode}"
         ylims = [(0, 1), (0, 1), (0, 1)]
 
-        plot_dual_metrics(
-            coex_metrics, node_count_cols, metric_cols, titles,
-            output_dir, output_prefix, ylims
-        )
+        nru_means = coex_metrics.groupby('nru_node_count', observed=True)[
+            ['nru_channel_occupancy', 'nru_channel_efficiency', 'nru_collision_probability']].mean()
+        wifi_means = coex_metrics.groupby('wifi_node_count', observed=True)[
+            ['wifi_channel_occupancy', 'wifi_channel_efficiency', 'wifi_collision_probability']].mean()
+        _plot_dual_metrics_3pairs(nru_means, wifi_means, ylims, output_dir, output_prefix, per_metric)
     except Exception as e:
         warnings.warn(f"Error processing coexistence {mode} metrics: {str(e)}")
 
-def parse_desync_filename(filename):
-    """Parse parameters from desync filenames"""
-    result = {}
-
-    # Extract desync values
-    desync_match = re.search(r"desync-(\d+)-(\d+)", filename)
-    if desync_match:
-        result['desync_min'] = desync_match.group(1)
-        result['desync_max'] = desync_match.group(2)
-
-    # Check if backoff is disabled
-    result['disabled_backoff'] = 'disabled-backoff' in filename
+# Filename patterns, compiled once at import
+_CW_RE = re.compile(r"adjusted-cw-([^_]+)")
+_SPECIFIC_CW_FILE_RE = re.compile(
+    fnmatch.translate('coex_gap-mode_desync-*_disabled-backoff_adjusted-cw-*_raw-data.csv'))
 
-    # Debug
-    # print(f"{result['disabled_backoff']} = 'disabled-backoff' {result['disabled_backoff']}")
 
-    # Extract CW value if present
-    cw_match = re.search(r"adjusted-cw-([^_]+)", filename)
-    result['cw_value'] = cw_match.group(1) if cw_match else None
+def _read_coex_table(csv_path):
+    """Read the coexistence columns of a simulation CSV into an Arrow table (requires pyarrow)"""
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+    convert_options = pacsv.ConvertOptions(
+        include_columns=list(_COEX_DTYPES),
+        column_types={col: pa.type_for_alias(t) for col, t in _COEX_DTYPES.items()})
+    return pacsv.read_csv(csv_path, read_options=read_options, convert_options=convert_options)
 
-    # print(f"result: {result}") Debug
 
+def _group_sums_counts(csv_path, metrics_by_node_col):
+    """
+    Per node count sums and counts of the metrics in one coexistence CSV.
+    Returns {node_col: (sums, counts)} with DataFrames indexed by node count.
+    The grouping runs in Arrow's C++ kernels when pyarrow is installed.
+    """
+    result = {}
+    if pacsv is None:
+        part = read_columns(csv_path, _COEX_DTYPES)
+        for node_col, cols in metrics_by_node_col.items():
+            grouped = part.groupby(node_col, observed=True, sort=False)[cols]
+            result[node_col] = (grouped.sum().astype('float64'), grouped.count())
+        return result
+
+    table = _read_coex_table(csv_path)
+    for node_col, cols in metrics_by_node_col.items():
+        aggregated = table.group_by(node_col).aggregate(
+            [(col, 'sum') for col in cols] + [(col, 'count') for col in cols]
+        ).to_pandas().set_index(node_col)
+        sums = aggregated[[f"{col}_sum" for col in cols]].set_axis(cols, axis=1)
+        counts = aggregated[[f"{col}_count" for col in cols]].set_axis(cols, axis=1)
+        result[node_col] = (sums, counts)
     return result
 
-def get_file_category(filename):
-    """Categorize files based on their parameters"""
-    params = parse_desync_filename(filename)
 
-    # Basic desync file with no additional parameters
-    if not params['disabled_backoff'] and not params['cw_value']:
-        return 'basic_desync'
-
-    # Disabled backoff but no CW adjustment
-    elif params['disabled_backoff'] and not params['cw_value']:
-        return 'disabled_backoff'
+def combine_file_means(files, node_count_cols, metric_cols):
+    """
+    Average metrics per node count over several CSVs without concatenating them.
+    Files are read one at a time and their group sums and counts folded into
+    running totals, so only one file and the per-group totals are held in memory.
+    Returns a dict mapping each node count column to a DataFrame of the means
+    of its metrics, indexed by node count.
+    """
+    metrics_by_node_col = _metrics_by_node_col(node_count_cols, metric_cols)
 
-    # Disabled backoff with specific CW value
-    elif params['disabled_backoff'] and params['cw_value'] != 'Varied':
-        return f"cw_{params['cw_value']}"
+    sums, counts = {}, {}
+    for f in files:
+        for node_col, (file_sums, file_counts) in _group_sums_counts(f, metrics_by_node_col).items():
+            if node_col in sums:
+                sums[node_col] = sums[node_col].add(file_sums, fill_value=0)
+                counts[node_col] = counts[node_col].add(file_counts, fill_value=0)
+            else:
+                sums[node_col], counts[node_col] = file_sums, file_counts
 
-    # Varied CW value
-    elif params['disabled_backoff'] and params['cw_value'] == 'Varied':
-        return 'varied_cw'
+    return {node_col: (sums[node_col] / counts[node_col]).sort_index() for node_col in sums}
 
-    # Fallback for unexpected cases
-    else:
-        return 'other'
 
-
-def process_desync_files(category='basic_desync'):
+@functools.lru_cache(maxsize=None)
+def _build_file_index(results_dir='output/simulation_results'):
+    """
+    Scan the results directory once and bucket the gap-mode desync CSVs by category:
+    {'basic_desync': [...], 'disabled_backoff': [...], 'varied_cw': [...], 'cw': {cw_value: [...]}}
+    """
+    index = {'basic_desync': [], 'disabled_backoff': [], 'varied_cw': [], 'cw': {}}
+    try:
+        entries = list(os.scandir(results_dir))
+    except FileNotFoundError:
+        return index
+
+    names = pd.Series([entry.name for entry in entries
+                       if fnmatch.fnmatch(entry.name, 'coex_gap-mode_desync-*_raw-data.csv')],
+                      dtype=object)
+    if names.empty:
+        return index
+    paths = pd.Series([os.path.join(results_dir, name) for name in names], dtype=object)
+
+    # Classify every filename at once: disabled backoff without an adjusted CW,
+    # with a "Varied" CW, or with a specific CW value
+    disabled_backoff = names.str.contains('disabled-backoff', regex=False)
+    cw_value = names.str.extract(_CW_RE, expand=False)
+    has_cw = cw_value.notna()
+    specific_cw = (names.str.match(_SPECIFIC_CW_FILE_RE) & (cw_value != 'Varied'))
+
+    # Simple desync files with no additional parameters
+    index['basic_desync'] = paths[~names.str.lower().str.contains('disabled-backoff', regex=False)].tolist()
+    index['disabled_backoff'] = paths[disabled_backoff & ~has_cw].tolist()
+    index['varied_cw'] = paths[disabled_backoff & (cw_value == 'Varied')].tolist()
+    # Files with a specific (non-"Varied") adjusted CW value
+    for path, value in zip(paths[specific_cw], cw_value[specific_cw]):
+        index['cw'].setdefault(value, []).append(path)
+
+    return index
+
+
+def process_desync_files(category='basic_desync', per_metric=False):
     """Process desync files by category and create appropriate plots"""
-    # Get all desync files
-    all_files = glob.glob('output/simulation_results/coex_gap-mode_desync-*_raw-data.csv')
+    # Get all desync files, already bucketed by category
+    file_index = _build_file_index()
 
     # print(f"ALL Files:")
     # # Loop Five Times
@@ -287,27 +496,21 @@ def process_desync_files(category='basic_desync'):
     # Filter files by category
     if category == 'basic_desync':
         # Simple desync files with no additional parameters
-        files = [f for f in all_files if 'disabled-backoff' not in f.lower()]
+        files = file_index['basic_desync']
         output_prefix = 'coexistence_gap_desync'
         output_dir = 'output/metrics_visualizations/coexistence_strategies/coexistence_gap_desync'
         print("\n*** Basic Desync Files ***\n")
 
     elif category == 'disabled_backoff':
         # Files with disabled backoff
-        files = [f for f in all_files if get_file_category(f) == 'disabled_backoff']
+        files = file_index['disabled_backoff']
         output_prefix = 'coexistence_gap_desync_disabled_backoff'
         output_dir = 'output/metrics_visualizations/coexistence_strategies/coexistence_gap_desync_disabled_backoff'
         print("\n*** Disabled Backoff Files ***\n")
 
     elif category == 'varied_cw':
         # Files with varied CW
-        files = [f for f in all_files if get_file_category(f) == 'varied_cw']
-
-        # print(f"\nFiles Catergory::")
-        # # Loop Five Times
-        # for i in all_files:
-            # # print(f"Loop iteration {i}: Found")
-            # print(f"Files: {i}  Catergory = {get_file_category(i)}")
+        files = file_index['varied_cw']
 
         output_prefix = 'coexistence_gap_desync_disabled_backoff_adjust_cw_Varied'
         output_dir = 'output/metrics_visualizations/coexistence_strategies/varied_cw'
@@ -334,9 +537,6 @@ def process_desync_files(category='basic_desync'):
 
     print(f"\nProcessing {len(files)} files for category: {category}")
 
-    # Load data from all matching files
-    coex_metrics = pd.concat([pd.read_csv(f) for f in files])
-
     # Define metrics to plot
     node_count_cols = ['nru_node_count', 'wifi_node_count'] * 3
     metric_cols = [
@@ -344,26 +544,20 @@ def process_desync_files(category='basic_desync'):
         'nru_channel_efficiency', 'wifi_channel_efficiency',
         'nru_collision_probability', 'wifi_collision_probability'
     ]
-    titles = [
-        ' NR-U', ' Wi-Fi',
-        ' NR-U', ' Wi-Fi',
-        ' NR-U', ' Wi-Fi'
-    ]
 
     # output_dir = 'output/metrics_visualizations/coexistence_strategies/coex_gap_desync'
     ylims = [(0.001, 1), (0, 1), (0, 1)]
 
-    plot_dual_metrics(
-        coex_metrics, node_count_cols, metric_cols, titles,
-        output_dir, output_prefix, ylims
-    )
+    # Average the data from all matching files and plot it
+    means = combine_file_means(files, node_count_cols, metric_cols)
+    _plot_dual_metrics_3pairs(means['nru_node_count'], means['wifi_node_count'], ylims, output_dir, output_prefix,
+                              per_metric)
 
 
-def process_specific_cw_value(cw_value):
+def process_specific_cw_value(cw_value, per_metric=False):
     """Process files for a specific CW value"""
     # Find files with this specific CW value
-    pattern = f'output/simulation_results/coex_gap-mode_desync-*-*_disabled-backoff_adjusted-cw-{cw_value}_raw-data.csv'
-    files = glob.glob(pattern)
+    files = _build_file_index()['cw'].get(cw_value, [])
 
     if not files:
         print(f"No files found for CW value: {cw_value}")
@@ -377,9 +571,6 @@ def process_specific_cw_value(cw_value):
 
     print(f"\nProcessing {len(files)} files for CW value: {cw_value}")
 
-    # Load data from all matching files
-    coex_metrics = pd.concat([pd.read_csv(f) for f in files])
-
     # Define metrics to plot
     node_count_cols = ['nru_node_count', 'wifi_node_count'] * 3
     metric_cols = [
@@ -387,11 +578,6 @@ def process_specific_cw_value(cw_value):
         'nru_channel_efficiency', 'wifi_channel_efficiency',
         'nru_collision_probability', 'wifi_collision_probability'
     ]
-    titles = [
-        ' NR-U', ' Wi-Fi',
-        ' NR-U', ' Wi-Fi',
-        ' NR-U', ' Wi-Fi'
-    ]
 
     # output_dir = f'output/metrics_visualizations/coexistence_strategies/coexistence_gap_desync_disabled_backoff_adjust_cw_{cw_value}'
     output_dir = f'output/metrics_visualizations/coexistence_strategies/cw_{cw_value}'
@@ -400,75 +586,93 @@ def process_specific_cw_value(cw_value):
 
     os.makedirs(output_dir, exist_ok=True)  # <-- Add this line
 
-    plot_dual_metrics(
-        coex_metrics, node_count_cols, metric_cols, titles,
-        output_dir, output_prefix, ylims
-    )
+    # Average the data from all matching files and plot it
+    means = combine_file_means(files, node_count_cols, metric_cols)
+    _plot_dual_metrics_3pairs(means['nru_node_count'], means['wifi_node_count'], ylims, output_dir, output_prefix,
+                              per_metric)
 
 
-def process_all_cw_files():
-    """Find all unique CW values and process each one separately"""
-    # Find all files with adjusted CW
-    pattern = 'output/simulation_results/coex_gap-mode_desync-*_disabled-backoff_adjusted-cw-*_raw-data.csv'
-    files = glob.glob(pattern)
+def find_cw_values():
+    """Return the sorted unique adjusted CW values (excluding "Varied") in the results"""
+    return sorted(_build_file_index()['cw'])
 
-    # Extract unique CW values (excluding "Varied")
-    cw_values = set()
-    for file in files:
-        cw_match = re.search(r"adjusted-cw-([^_]+)", file)
-        if cw_match and cw_match.group(1) != 'Varied':
-            cw_values.add(cw_match.group(1))
 
-    print(f"\nFound {len(cw_values)} unique CW values: {', '.join(cw_values)}")
+def _init_worker():
+    """ProcessPoolExecutor initializer: headless backend and the shared color palette"""
+    mpl.use('Agg')
+    set_distinct_color_palette()
 
-    # Process each CW value separately
-    for cw_value in cw_values:
-        process_specific_cw_value(cw_value)
 
+def _run_task(task):
+    """Worker: run one plotting job and return everything it printed and the number of plots saved"""
+    func, args = task
+    plots_before = _PLOT_COUNT
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        func(*args)
+    return buffer.getvalue(), _PLOT_COUNT - plots_before
 
-def main():
-    set_distinct_color_palette()
 
-    print("\n=== Starting Metrics Visualization Process ===\n")
+def _prewarm_matplotlib():
+    """Load fonts and the Agg renderer once so forked workers inherit them warm"""
+    fig = plt.figure()
+    fig.text(0.5, 0.5, "warm-up")
+    fig.canvas.draw()
+    plt.close(fig)
 
-    # Plot individual metrics
-    print("Processing WiFi metrics...")
-    plot_wifi_metrics()  # Wi-Fi alone
 
-    print("\nProcessing NR-U 'rs' metrics...")
-    plot_nru_metrics('rs')  # NR-U rs alone
+def main():
+    parser = argparse.ArgumentParser(description='Generate network metric plots')
+    parser.add_argument('--per-metric', action='store_true',
+                        help='Save one PNG per metric (or NR-U/Wi-Fi metric pair) instead of combined figures')
+    args = parser.parse_args()
 
-    print("\nProcessing NR-U 'gap' metrics...")
-    plot_nru_metrics('gap')  # NR-U gap alone
+    set_distinct_color_palette()
+    _prewarm_matplotlib()
 
-    # Plot coexistence metrics
-    print("\nProcessing coexistence 'rs' metrics...")
-    plot_coexistence_metrics('rs')  # Coexistence with rs
+    print("\n=== Starting Metrics Visualization Process ===\n")
 
-    print("\nProcessing coexistence 'gap' metrics...")
-    plot_coexistence_metrics('gap')  # Coexistence with gap
+    cw_values = find_cw_values()
 
-    print("\n=== Processing Desync Files ===")
+    # Every plotting job is independent, so they run in parallel worker processes.
+    # Each job is listed with the header printed before its (captured) output.
+    tasks = [
+        # Plot individual metrics
+        ("Processing WiFi metrics...", plot_wifi_metrics, (args.per_metric,)),  # Wi-Fi alone
+        ("\nProcessing NR-U 'rs' metrics...", plot_nru_metrics, ('rs', args.per_metric)),  # NR-U rs alone
+        ("\nProcessing NR-U 'gap' metrics...", plot_nru_metrics, ('gap', args.per_metric)),  # NR-U gap alone
 
-    # Process desync files by category
-    process_desync_files('basic_desync')  # Basic desync files
-    process_desync_files('disabled_backoff')  # Files with disabled backoff
-    process_desync_files('varied_cw')  # Files with varied CW
+        # Plot coexistence metrics
+        ("\nProcessing coexistence 'rs' metrics...", plot_coexistence_metrics, ('rs', args.per_metric)),  # Coexistence with rs
+        ("\nProcessing coexistence 'gap' metrics...", plot_coexistence_metrics, ('gap', args.per_metric)),  # Coexistence with gap
+
+        # Process desync files by category
+        ("\n=== Processing Desync Files ===", process_desync_files, ('basic_desync', args.per_metric)),  # Basic desync files
+        (None, process_desync_files, ('disabled_backoff', args.per_metric)),  # Files with disabled backoff
+        (None, process_desync_files, ('varied_cw', args.per_metric)),  # Files with varied CW
+    ]
 
-    print("\n=== Processing CW Files ===")
     # Process files with specific CW values
-    process_all_cw_files()
+    cw_header = ("\n=== Processing CW Files ===\n"
+                 f"\nFound {len(cw_values)} unique CW values: {', '.join(cw_values)}")
+    for cw_value in cw_values:
+        tasks.append((cw_header, process_specific_cw_value, (cw_value, args.per_metric)))
+        cw_header = None
+    if cw_header is not None:
+        print(cw_header)
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as executor:
+        outputs = executor.map(_run_task, [(func, args) for _, func, args in tasks])
+        total_plots = 0
+        for (header, _, _), (output, plot_count) in zip(tasks, outputs):
+            if header is not None:
+                print(header)
+            print(output, end='')
+            total_plots += plot_count
 
     print("\n=== Summary of Generated Output Files ===")
 
-    # List all generated image files
-    all_output_files = []
-    for root, dirs, files in os.walk('output/metrics_visualizations'):
-        for file in files:
-            if file.endswith('.png'):
-                all_output_files.append(os.path.join(root, file))
-
-    print(f"\nTotal number of generated plots: {len(all_output_files)}")
+    print(f"\nTotal number of generated plots: {total_plots}")
 
     print("\n=== Metrics Visualization Complete ===\n")
 